@@ -45,6 +45,7 @@ class UltralyticsEngine(BaseInferenceEngine):
         self.device = kwargs.get('device', "CPU")  # Default device
         self.output_format = kwargs.get('output_format', "geti")  # Default output format
         self.task = kwargs.get('task', 'detect')  # Default task for YOLO models
+        self.precision = str(kwargs.get('precision', 'fp32')).lower()  # OpenVINO export precision ('fp32' or 'int8')
         self.deployment = None
         self.use_openvino = False
         self.openvino_model_path = None
@@ -175,6 +176,12 @@ class UltralyticsEngine(BaseInferenceEngine):
                     model_folder = os.path.dirname(model_file)
                     self.openvino_model_path = os.path.join(model_folder, f"{model_name}_openvino_model")
                     
+                    # INT8 quantization is only worthwhile on the CPU plugin (VNNI/AMX)
+                    if self.precision == 'int8' and device.startswith('intel:cpu'):
+                        int8_model_path = self._export_openvino_int8(model_name, model_folder)
+                        if int8_model_path:
+                            self.openvino_model_path = int8_model_path
+                    
                     # Export to OpenVINO format if not already exists
                     if not os.path.exists(self.openvino_model_path):
                         print(f"Exporting model to OpenVINO format: {self.openvino_model_path}")
@@ -224,6 +231,26 @@ class UltralyticsEngine(BaseInferenceEngine):
             traceback.print_exc()
             return False
 
+    def _export_openvino_int8(self, model_name: str, model_folder: str) -> str | None:
+        """
+        Export the loaded model to an INT8 quantized OpenVINO model (via NNCF).
+        The export is cached next to the original model so quantization only
+        happens once. Returns the model path, or None if quantization failed.
+        """
+        int8_model_path = os.path.join(model_folder, f"{model_name}_int8_openvino_model")
+        if os.path.exists(int8_model_path):
+            return int8_model_path
+        
+        try:
+            print(f"Exporting INT8 quantized OpenVINO model: {int8_model_path}")
+            self.model.export(format="openvino", int8=True, name=model_name)
+            if os.path.exists(int8_model_path):
+                return int8_model_path
+            print("WARNING: INT8 export did not produce a model, falling back to FP32")
+        except Exception as e:
+            print(f"WARNING: INT8 quantization failed ({e}), falling back to FP32")
+        return None
+
     def _show_yolov5_guidance(self, model_file: str):
         """Show helpful guidance for YOLOv5 compatibility issues"""
         print("\n" + "=" * 70)
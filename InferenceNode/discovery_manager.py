@@ -6,14 +6,16 @@ Integrated discovery service for finding and managing other InferNode instances
 This replaces the separate discovery server and integrates directly into the main InferenceNode application.
 """
 
+import re
 import json
 import socket
+import selectors
 import threading
 import time
 import requests
 import concurrent.futures
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 # Try to import zeroconf for mDNS support
@@ -30,6 +32,48 @@ except ImportError:
         pass
 
 
+# Service type InferNode nodes register and browse for over mDNS (standard HTTP service type)
+_MDNS_SERVICE_TYPE = "_http._tcp.local."
+
+# API ports tried on each host during an active network scan
+_SCAN_PORTS = (5000, 5001, 5002, 5555, 8000, 8080)
+
+# Node information fields carried in UDP announcements/responses - what DiscoveredNode reads.
+# The full node information (hardware details etc.) is fetched from /api/info when probing.
+_ANNOUNCED_FIELDS = ('node_id', 'node_name', 'version', 'platform', 'cpu_count', 'memory_gb',
+                     'available_engines', 'gpu', 'api_port')
+
+# Message types the discovery listener acts on, matched on the raw datagram so that other
+# traffic on the port (including discovery responses) is dropped without a JSON parse
+_HANDLED_MESSAGE_RE = re.compile(rb'"type"\s*:\s*"(?:node_announcement|discovery_request)"')
+
+
+def get_local_ip() -> str:
+    """
+    Get the IP address of the interface used for outbound traffic
+    
+    A UDP connect() only selects a route, no packets are sent. Falls back to resolving
+    the hostname when there is no route (e.g. offline hosts).
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.connect(("8.8.8.8", 80))
+        return sock.getsockname()[0]
+    except OSError:
+        return socket.gethostbyname(socket.gethostname())
+    finally:
+        sock.close()
+
+
+def _port_open(ip: str, port: int, timeout: float) -> bool:
+    """Check whether a TCP connection to ip:port can be established within timeout"""
+    try:
+        with socket.create_connection((ip, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
 class MDNSServiceListener(ServiceListenerBase):  # type: ignore
     """Listener for mDNS service discovery events"""
     
@@ -119,11 +163,7 @@ class MDNSServiceListener(ServiceListenerBase):  # type: ignore
                 self.logger.info(f"Discovered mDNS node: {node_data['node_name']} ({node_id}) at {ip_address}:{port}")
                 
                 # Probe the new node for detailed information
-                threading.Thread(
-                    target=self.discovery_manager._probe_node,
-                    args=(node_id,),
-                    daemon=True
-                ).start()
+                self.discovery_manager.submit_probe(node_id)
         
         except Exception as e:
             self.logger.error(f"Error processing mDNS service {name}: {str(e)}")
@@ -164,49 +204,22 @@ class MDNSBroadcaster:
             return True
         
         try:
-            from zeroconf import Zeroconf, ServiceInfo
-            
             self.zeroconf = Zeroconf()
             
             # Service type for InferNode discovery (using standard HTTP service type)
-            service_type = "_http._tcp.local."
+            service_type = _MDNS_SERVICE_TYPE
             service_name = f"InferNode-{self.node_id}.{service_type}"
             
-            # Get local IP address (using the same method as network scan to get actual network IP)
-            try:
-                # Connect to external address to determine local network IP
-                temp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                temp_sock.connect(("8.8.8.8", 80))
-                local_ip = temp_sock.getsockname()[0]
-                temp_sock.close()
-            except Exception as e:
-                # Fallback to hostname resolution if the above fails
-                self.logger.warning(f"Failed to get network IP via connection test: {e}")
-                hostname = socket.gethostname()
-                local_ip = socket.gethostbyname(hostname)
+            # Advertise the address of the interface other nodes can actually reach
+            local_ip = get_local_ip()
             
             hostname = socket.gethostname()
             
-            # Prepare service properties
-            properties = {
-                'node_id': self.node_id,
-                'node_name': self.node_info.get('node_name', 'Unknown Node'),
-                'platform': self.node_info.get('platform', 'Unknown'),
-                'cpu_count': str(self.node_info.get('cpu_count', 0)),
-                'memory_gb': str(self.node_info.get('memory_gb', 0)),
-                'available_engines': json.dumps(self.node_info.get('available_engines', [])),
-                'gpu': json.dumps(self.node_info.get('gpu', {'available': False}))
-            }
-            
-            # Create service info
-            self.service_info = ServiceInfo(
-                service_type,
-                service_name,
-                addresses=[socket.inet_aton(local_ip)],
-                port=self.service_port,
-                properties=properties,
-                server=f"{hostname}.local."
-            )
+            # Packed address and host name are fixed for the registration; update_info reuses them
+            self._service_name = service_name
+            self._addresses = [socket.inet_aton(local_ip)]
+            self._server = f"{hostname}.local."
+            self.service_info = self._build_service_info(self._service_properties())
             
             # Register service
             self.zeroconf.register_service(self.service_info)
@@ -235,12 +248,59 @@ class MDNSBroadcaster:
         except Exception as e:
             self.logger.error(f"Error stopping mDNS broadcaster: {str(e)}")
     
+    def _service_properties(self) -> Dict[str, str]:
+        """Build the mDNS TXT properties from the node information"""
+        return {
+            'node_id': self.node_id,
+            'node_name': self.node_info.get('node_name', 'Unknown Node'),
+            'platform': self.node_info.get('platform', 'Unknown'),
+            'cpu_count': str(self.node_info.get('cpu_count', 0)),
+            'memory_gb': str(self.node_info.get('memory_gb', 0)),
+            'available_engines': json.dumps(self.node_info.get('available_engines', [])),
+            'gpu': json.dumps(self.node_info.get('gpu', {'available': False}))
+        }
+    
+    def _build_service_info(self, properties: Dict[str, str]):
+        """Create the ServiceInfo for this node's registration"""
+        return ServiceInfo(
+            _MDNS_SERVICE_TYPE,
+            self._service_name,
+            addresses=self._addresses,
+            port=self.service_port,
+            properties=properties,
+            server=self._server
+        )
+    
     def update_info(self, node_info: Dict[str, Any]):
-        """Update node information and re-register service"""
+        """Update node information and the registered service if its properties changed"""
         self.node_info = node_info
-        if self.running:
+        if not self.running:
+            return
+        
+        # Most node info updates (e.g. pipeline stats) don't touch the advertised properties
+        properties = self._service_properties()
+        if properties == self._properties_of(self.service_info):
+            return
+        
+        try:
+            # Update the existing registration in place rather than unregistering and re-probing
+            service_info = self._build_service_info(properties)
+            self.zeroconf.update_service(service_info)
+            self.service_info = service_info
+        except Exception as e:
+            self.logger.debug(f"mDNS in-place update failed, re-registering: {str(e)}")
             self.stop()
             self.start()
+    
+    @staticmethod
+    def _properties_of(service_info) -> Optional[Dict[str, str]]:
+        """Decode a ServiceInfo's TXT properties back to strings"""
+        if service_info is None or not service_info.properties:
+            return None
+        return {
+            (k.decode('utf-8') if isinstance(k, bytes) else k): (v.decode('utf-8') if isinstance(v, bytes) else v)
+            for k, v in service_info.properties.items()
+        }
 
 
 class DiscoveredNode:
@@ -256,19 +316,20 @@ class DiscoveredNode:
         self.memory_gb = node_data.get('memory_gb', 0)
         self.available_engines = node_data.get('available_engines', [])
         self.gpu = node_data.get('gpu', {'available': False})
-        self.last_seen = datetime.now()
+        self.last_seen_ts = time.time()  # Epoch seconds, see last_seen
         self.status = 'online'
         self.response_time = 0
         self.capabilities = node_data
         # Additional information fetched during probing
         self.pipeline_info: Optional[Dict[str, Any]] = None
         self.system_metrics: Optional[Dict[str, Any]] = None
-        # Use the JSON info endpoint for API probing
-        self.api_url = f"http://{ip_address}:{port}/api/info"
+        # Base URL and the JSON info endpoint used for API probing (address and port are fixed per node)
+        self.url = f"http://{ip_address}:{port}"
+        self.api_url = f"{self.url}/api/info"
         
     def update_status(self, response_time: Optional[float] = None):
         """Update node status and last seen time"""
-        self.last_seen = datetime.now()
+        self.last_seen_ts = time.time()
         self.status = 'online'
         if response_time is not None:
             self.response_time = response_time
@@ -277,9 +338,14 @@ class DiscoveredNode:
         """Mark node as offline"""
         self.status = 'offline'
         
+    @property
+    def last_seen(self) -> datetime:
+        """When the node was last seen (kept as a timestamp, converted only when read)"""
+        return datetime.fromtimestamp(self.last_seen_ts)
+        
     def is_stale(self, timeout_minutes: int = 5) -> bool:
         """Check if node hasn't been seen for too long"""
-        return datetime.now() - self.last_seen > timedelta(minutes=timeout_minutes)
+        return time.time() - self.last_seen_ts > timeout_minutes * 60
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -296,8 +362,8 @@ class DiscoveredNode:
             'last_seen': self.last_seen.isoformat(),
             'status': self.status,
             'response_time': self.response_time,
-            'url': f"http://{self.ip_address}:{self.port}",
-            'api_url': f"http://{self.ip_address}:{self.port}/api/info"
+            'url': self.url,
+            'api_url': self.api_url
         }
         
         # Add pipeline information if available
@@ -314,6 +380,16 @@ class DiscoveredNode:
 class DiscoveryManager:
     """Manages discovery of other InferNode instances on the network"""
     
+    # Kernel buffer sizes requested for the discovery sockets, large enough to absorb a burst of
+    # announcements carrying hardware details (the OS may cap or, on Linux, double the value)
+    SOCKET_RCVBUF = 1024 * 1024
+    SOCKET_SNDBUF = 256 * 1024
+    
+    # Discovery responses allowed per source IP: a burst of RESPONSE_BURST, refilled at
+    # RESPONSE_RATE per second, so a flood of requests can't keep us busy replying
+    RESPONSE_BURST = 5.0
+    RESPONSE_RATE = 1.0
+    
     def __init__(self, discovery_port: int = 8888, node_id: Optional[str] = None, node_info: Optional[Dict[str, Any]] = None):
         self.discovery_port = discovery_port
         self.node_id = node_id
@@ -322,7 +398,23 @@ class DiscoveryManager:
         self.discovery_running = False
         self.discovery_thread = None
         self.broadcast_thread = None
+        self._sock: Optional[socket.socket] = None  # Discovery socket shared by the listener, responses and broadcasts
+        self._wakeup: Optional[tuple] = None  # (read, write) socket pair that wakes the listener on stop
+        self._stop_event = threading.Event()  # Wakes the discovery threads immediately on stop
         self.broadcast_interval = 10.0  # seconds
+        self.cleanup_interval = 10.0  # seconds between stale node checks
+        self.refresh_interval = 30.0  # seconds between node information refreshes
+        self.max_probe_workers = 8  # concurrent node probes
+        self.scan_connect_timeout = 0.5  # seconds allowed for a TCP connect during network scans
+        # Shared pool for node probes (new nodes and refreshes), created on first use
+        self._probe_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._probe_executor_lock = threading.Lock()
+        # Source IP -> (tokens, last refill time) for discovery response rate limiting
+        self._response_buckets: Dict[str, tuple] = {}
+        # Keep-alive HTTP session for probing nodes, so the several requests per probe share a connection
+        self._http = requests.Session()
+        # Serialized message heads per message type (everything but the timestamp), see _encode_message
+        self._message_prefixes: Dict[str, bytes] = {}
         
         # mDNS components
         self.mdns_broadcaster = None
@@ -343,6 +435,7 @@ class DiscoveryManager:
         """Set the node information for broadcasting"""
         self.node_id = node_id
         self.node_info = node_info
+        self._message_prefixes = {}
         self.logger.debug(f"Node info updated for discovery: {node_info.get('node_name', 'Unknown')} ({node_id})")
         
         # Update mDNS broadcaster if it exists
@@ -361,10 +454,14 @@ class DiscoveryManager:
             return
         
         self.discovery_running = True
+        self._stop_event.clear()
         
-        # Start UDP listener thread
-        self.discovery_thread = threading.Thread(target=self._discovery_worker, daemon=True)
-        self.discovery_thread.start()
+        # Start UDP listener thread on the shared discovery socket
+        self._sock = self._open_discovery_socket()
+        if self._sock:
+            self._wakeup = socket.socketpair()
+            self.discovery_thread = threading.Thread(target=self._discovery_worker, daemon=True)
+            self.discovery_thread.start()
         
         # Start mDNS if available and we have node info
         if self.use_mdns and self.node_id and self.node_info:
@@ -382,6 +479,12 @@ class DiscoveryManager:
     def stop_discovery(self):
         """Stop discovery service"""
         self.discovery_running = False
+        self._stop_event.set()
+        if self._wakeup:
+            try:
+                self._wakeup[1].send(b'\0')
+            except OSError:
+                pass
         
         # Stop mDNS
         self._stop_mdns()
@@ -390,6 +493,17 @@ class DiscoveryManager:
             self.discovery_thread.join(timeout=2)
         if self.broadcast_thread:
             self.broadcast_thread.join(timeout=2)
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+        if self._wakeup:
+            for wakeup_sock in self._wakeup:
+                wakeup_sock.close()
+            self._wakeup = None
+        with self._probe_executor_lock:
+            if self._probe_executor:
+                self._probe_executor.shutdown(wait=False)
+                self._probe_executor = None
         self.logger.info("Stopped node discovery")
     
     def _start_mdns(self):
@@ -398,8 +512,6 @@ class DiscoveryManager:
             return
         
         try:
-            from zeroconf import Zeroconf, ServiceBrowser
-            
             # Start mDNS broadcaster
             api_port = self.node_info.get('api_port', 5000)
             self.mdns_broadcaster = MDNSBroadcaster(self.node_id, self.node_info, api_port)
@@ -411,7 +523,7 @@ class DiscoveryManager:
             self.mdns_listener = MDNSServiceListener(self)
             self.mdns_browser = ServiceBrowser(
                 self.zeroconf,
-                "_http._tcp.local.",
+                _MDNS_SERVICE_TYPE,
                 self.mdns_listener
             )
             self.logger.info("mDNS browser started")
@@ -440,80 +552,113 @@ class DiscoveryManager:
         except Exception as e:
             self.logger.error(f"Error stopping mDNS: {str(e)}")
     
-    def _discovery_worker(self):
-        """UDP discovery worker thread"""
-        sock = None
-        last_refresh = time.time()
-        refresh_interval = 30  # Refresh node information every 30 seconds
+    def _open_discovery_socket(self) -> Optional[socket.socket]:
+        """Create the UDP discovery socket, bound to the discovery port
         
+        The one socket receives announcements and requests and also sends our broadcasts
+        and discovery responses.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         try:
-            # Create UDP socket for discovery
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            sock.settimeout(1.0)  # 1 second timeout
+            # Lets several nodes on one host share the discovery port on BSD/macOS, where
+            # SO_REUSEADDR alone doesn't allow it (not available on Windows)
+            if hasattr(socket, 'SO_REUSEPORT'):
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                except OSError:
+                    pass
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.settimeout(1.0)  # Bounds sends; the listener waits in a selector, see _discovery_worker
             
-            # Increase receive buffer size to handle large hardware info messages
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+            # Increase receive buffer size to handle bursts of large hardware info messages
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_RCVBUF)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_SNDBUF)
+            self.logger.debug(f"Discovery receive buffer: {sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)} bytes "
+                              f"(requested {self.SOCKET_RCVBUF})")
             
             # Bind to discovery port
             sock.bind(('', self.discovery_port))
             self.logger.info(f"Discovery service listening on UDP port {self.discovery_port}")
+            return sock
             
+        except Exception as e:
+            sock.close()
+            self.logger.error(f"Failed to start discovery service: {str(e)}")
+            return None
+    
+    def _discovery_worker(self):
+        """UDP discovery worker thread"""
+        sock = self._sock
+        wakeup = self._wakeup[0]
+        # Housekeeping runs on its own schedule, whether or not announcements keep arriving
+        now = time.monotonic()
+        next_cleanup = now + self.cleanup_interval
+        next_refresh = now + self.refresh_interval
+        
+        # Sleep until a datagram arrives, housekeeping is due or stop_discovery wakes us up
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ)
+        selector.register(wakeup, selectors.EVENT_READ)
+        try:
             while self.discovery_running:
+                timeout = max(0.0, min(next_cleanup, next_refresh) - time.monotonic())
                 try:
-                    # Listen for discovery announcements (increased buffer for hardware details)
-                    data, addr = sock.recvfrom(8192)
-                    self._handle_discovery_message(data, addr)
-                    
-                except socket.timeout:
-                    # Check for stale nodes periodically
-                    self._cleanup_stale_nodes()
-                    
-                    # Refresh node information periodically
-                    current_time = time.time()
-                    if current_time - last_refresh > refresh_interval:
-                        self.refresh_all_nodes()
-                        last_refresh = current_time
-                    
-                    continue
+                    for key, _ in selector.select(timeout):
+                        if key.fileobj is wakeup:
+                            wakeup.recv(64)
+                            continue
+                        # Listen for discovery announcements (increased buffer for hardware details)
+                        data, addr = sock.recvfrom(8192)
+                        self._handle_discovery_message(data, addr)
+                        
                 except Exception as e:
                     if self.discovery_running:
                         self.logger.error(f"Discovery error: {str(e)}")
-                    
-        except Exception as e:
-            self.logger.error(f"Failed to start discovery service: {str(e)}")
+                
+                now = time.monotonic()
+                
+                # Check for stale nodes periodically
+                if now >= next_cleanup:
+                    self._cleanup_stale_nodes()
+                    next_cleanup = now + self.cleanup_interval
+                
+                # Refresh node information periodically
+                if now >= next_refresh:
+                    self.refresh_all_nodes()
+                    next_refresh = time.monotonic() + self.refresh_interval
         finally:
-            if sock:
-                sock.close()
-            self.logger.info("Discovery service stopped")
+            selector.close()
+        
+        self.logger.info("Discovery service stopped")
     
     def _broadcast_loop(self):
         """Periodically broadcast node presence"""
-        while self.discovery_running:
-            try:
-                self._send_broadcast()
-                time.sleep(self.broadcast_interval)
-            except Exception as e:
-                self.logger.error(f"Broadcast error: {str(e)}")
-                time.sleep(self.broadcast_interval)
+        # Announce from the shared discovery socket; if it couldn't be bound, use a
+        # broadcast-only socket of our own for the life of the loop
+        sock = self._sock
+        own_sock = None
+        if sock is None:
+            sock = own_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            own_sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        try:
+            while self.discovery_running:
+                try:
+                    self._send_broadcast(sock)
+                except Exception as e:
+                    self.logger.error(f"Broadcast error: {str(e)}")
+                self._stop_event.wait(self.broadcast_interval)
+        finally:
+            if own_sock:
+                own_sock.close()
     
-    def _send_broadcast(self):
+    def _send_broadcast(self, sock: socket.socket):
         """Send broadcast announcement"""
         if not self.node_id or not self.node_info:
             return
             
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            
-            announcement = {
-                'type': 'node_announcement',
-                'node_id': self.node_id,
-                'node_info': self.node_info,
-                'timestamp': time.time()
-            }
-            
-            data = json.dumps(announcement).encode('utf-8')
+            data = self._encode_message('node_announcement')
             
             # Send to broadcast address only (more efficient and reduces duplicates)
             try:
@@ -530,16 +675,33 @@ class DiscoveryManager:
             
         except Exception as e:
             self.logger.error(f"Broadcast send error: {str(e)}")
-        finally:
-            try:
-                sock.close()
-            except:
-                pass
+    
+    def _encode_message(self, message_type: str) -> bytes:
+        """
+        Serialize a discovery message carrying our node information
+        
+        Only the _ANNOUNCED_FIELDS of the node information are sent. They only change
+        through set_node_info, so everything up to the timestamp is encoded once per message
+        type and reused; only the timestamp is formatted per send.
+        """
+        prefix = self._message_prefixes.get(message_type)
+        if prefix is None:
+            head = json.dumps({
+                'type': message_type,
+                'node_id': self.node_id,
+                'node_info': {key: self.node_info[key] for key in _ANNOUNCED_FIELDS if key in self.node_info}
+            })
+            prefix = (head[:-1] + ', "timestamp": ').encode('utf-8')
+            self._message_prefixes[message_type] = prefix
+        return prefix + repr(time.time()).encode('ascii') + b'}'
     
     def _handle_discovery_message(self, data: bytes, addr: tuple):
         """Handle incoming discovery message"""
+        if not _HANDLED_MESSAGE_RE.search(data):
+            return
+        
         try:
-            message = json.loads(data.decode('utf-8'))
+            message = json.loads(data)
             
             if message.get('type') == 'node_announcement':
                 node_data = message.get('node_info', {})
@@ -563,43 +725,50 @@ class DiscoveryManager:
                         self.logger.info(f"Discovered new node: {node_data.get('node_name', 'Unknown')} ({node_id}) at {ip_address}:{port}")
                         
                         # Probe the new node for detailed information
-                        threading.Thread(target=self._probe_node, args=(node_id,), daemon=True).start()
+                        self.submit_probe(node_id)
             
             elif message.get('type') == 'discovery_request':
                 self.logger.debug(f"Received discovery request from {addr[0]}")
                 # Respond with our node information if we have it
-                if self.node_id and self.node_info:
+                if self.node_id and self.node_info and self._allow_response(addr[0]):
                     self._send_discovery_response(addr)
                 
         except Exception as e:
             self.logger.error(f"Failed to parse discovery message from {addr}: {str(e)}")
     
+    def _allow_response(self, ip: str) -> bool:
+        """Token bucket check for answering a discovery request from ip"""
+        now = time.monotonic()
+        buckets = self._response_buckets
+        tokens, last = buckets.get(ip, (self.RESPONSE_BURST, now))
+        tokens = min(self.RESPONSE_BURST, tokens + (now - last) * self.RESPONSE_RATE)
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+        else:
+            self.logger.debug(f"Rate limiting discovery responses to {ip}")
+        buckets[ip] = (tokens, now)
+        
+        # Forget sources whose bucket has refilled, so the table can't grow without bound
+        if len(buckets) > 1024:
+            refill_time = self.RESPONSE_BURST / self.RESPONSE_RATE
+            for key in [k for k, (_, ts) in buckets.items() if now - ts > refill_time]:
+                del buckets[key]
+        return allowed
+    
     def _send_discovery_response(self, addr: tuple):
         """Send discovery response to a specific address"""
         if not self.node_id or not self.node_info:
             return
             
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            
-            response = {
-                'type': 'discovery_response',
-                'node_id': self.node_id,
-                'node_info': self.node_info,
-                'timestamp': time.time()
-            }
-            
-            data = json.dumps(response).encode('utf-8')
-            sock.sendto(data, addr)
+            # Reply from the discovery socket itself (the request arrived on it)
+            data = self._encode_message('discovery_response')
+            self._sock.sendto(data, addr)
             self.logger.debug(f"Sent discovery response to {addr}")
             
         except Exception as e:
             self.logger.error(f"Failed to send discovery response to {addr}: {str(e)}")
-        finally:
-            try:
-                sock.close()
-            except:
-                pass
     
     def _probe_node(self, node_id: str):
         """Probe a node for detailed information"""
@@ -609,7 +778,7 @@ class DiscoveryManager:
         node = self.discovered_nodes[node_id]
         try:
             start_time = time.time()
-            response = requests.get(node.api_url, timeout=5)
+            response = self._http.get(node.api_url, timeout=5)
             response_time = (time.time() - start_time) * 1000
             
             if response.status_code == 200:
@@ -649,7 +818,7 @@ class DiscoveryManager:
                 
                 # Get pipeline information
                 try:
-                    pipeline_response = requests.get(f"http://{node.ip_address}:{node.port}/api/pipelines/summary", timeout=3)
+                    pipeline_response = self._http.get(f"{node.url}/api/pipelines/summary", timeout=3)
                     if pipeline_response.status_code == 200:
                         node.pipeline_info = pipeline_response.json()
                     else:
@@ -659,7 +828,7 @@ class DiscoveryManager:
                 
                 # Get system metrics (if available)
                 try:
-                    metrics_response = requests.get(f"http://{node.ip_address}:{node.port}/api/node/info", timeout=3)
+                    metrics_response = self._http.get(f"{node.url}/api/node/info", timeout=3)
                     if metrics_response.status_code == 200:
                         metrics_data = metrics_response.json()
                         # Extract relevant metrics
@@ -681,11 +850,23 @@ class DiscoveryManager:
             self.logger.warning(f"Failed to probe node {node_id}: {str(e)}")
             node.mark_offline()
     
+    def submit_probe(self, node_id: str) -> concurrent.futures.Future:
+        """Probe a node in the background on the shared probe pool"""
+        with self._probe_executor_lock:
+            if self._probe_executor is None:
+                self._probe_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_probe_workers, thread_name_prefix='DiscoveryProbe'
+                )
+            return self._probe_executor.submit(self._probe_node, node_id)
+    
     def refresh_all_nodes(self):
         """Refresh information for all online nodes"""
-        for node_id, node in list(self.discovered_nodes.items()):
-            if node.status == 'online':
-                self._probe_node(node_id)
+        node_ids = [node_id for node_id, node in list(self.discovered_nodes.items()) if node.status == 'online']
+        if not node_ids:
+            return
+        
+        # Probe concurrently so one slow or unreachable node doesn't hold up the rest
+        concurrent.futures.wait([self.submit_probe(node_id) for node_id in node_ids])
     
     def _cleanup_stale_nodes(self):
         """Remove nodes that haven't been seen for too long"""
@@ -703,17 +884,18 @@ class DiscoveryManager:
         # Get local network range
         try:
             # Get local IP to determine network range
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.connect(("8.8.8.8", 80))
-            local_ip = sock.getsockname()[0]
-            sock.close()
+            local_ip = get_local_ip()
             
             # Simple scan of common ports on local subnet
             ip_parts = local_ip.split('.')
             base_ip = '.'.join(ip_parts[:3])
             
             def scan_ip(ip):
-                for port in [5000, 5001, 5002, 5555, 8000, 8080]:
+                for port in _SCAN_PORTS:
+                    # Cheap TCP connect first: most addresses have no host or no listener, and
+                    # that shouldn't cost a full HTTP timeout per port
+                    if not _port_open(ip, port, self.scan_connect_timeout):
+                        continue
                     try:
                         response = requests.get(f"http://{ip}:{port}/api/info", timeout=2)
                         if response.status_code == 200:
@@ -756,7 +938,7 @@ class DiscoveryManager:
         node = self.discovered_nodes[node_id]
         # Try to get fresh info from the node
         try:
-            response = requests.get(node.api_url, timeout=5)
+            response = self._http.get(node.api_url, timeout=5)
             if response.status_code == 200:
                 fresh_data = response.json()
                 return fresh_data
@@ -776,7 +958,7 @@ class DiscoveryManager:
             if action == 'ping':
                 # Ping the node
                 start_time = time.time()
-                response = requests.get(node.api_url, timeout=5)
+                response = self._http.get(node.api_url, timeout=5)
                 response_time = (time.time() - start_time) * 1000
                 
                 if response.status_code == 200:
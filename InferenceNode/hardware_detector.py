@@ -1,3 +1,4 @@
+import os
 import logging
 import platform
 import subprocess
@@ -16,12 +17,19 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
+try:
+    import wmi  # Windows only: native WMI queries instead of spawning PowerShell
+    HAS_WMI = True
+except ImportError:
+    HAS_WMI = False
+
 
 class HardwareDetector():
     """Generic hardware detection for inference engines"""
 
     def __init__(self):
         """Initialize and detect all available hardware once"""
+        self._windows_names: Dict[str, str] = {}  # WMI class -> instance names, see _get_windows_names
         self.hardware_info = self._detect_all_hardware()
 
     def __str__(self) -> str:
@@ -264,6 +272,37 @@ class HardwareDetector():
         except Exception:
             return None
 
+    def _get_windows_names(self, wmi_class: str) -> str:
+        """
+        Get the names of all instances of a WMI class (e.g. Win32_Processor), one per line.
+        
+        Several detectors need the processor and video controller names, so each class is
+        queried once: natively through the wmi package when installed, otherwise with a
+        single PowerShell call. Returns an empty string if both fail.
+        
+        Args:
+            wmi_class: WMI class name
+            
+        Returns:
+            Newline separated instance names
+        """
+        if wmi_class in self._windows_names:
+            return self._windows_names[wmi_class]
+        
+        names = None
+        if HAS_WMI:
+            try:
+                names = '\n'.join(item.Name or '' for item in wmi.WMI().query(f"SELECT Name FROM {wmi_class}"))
+            except Exception:
+                names = None
+        if names is None:
+            names = self._run_command(
+                f'powershell "Get-CimInstance -ClassName {wmi_class} | Select-Object -ExpandProperty Name"'
+            ) or ''
+        
+        self._windows_names[wmi_class] = names
+        return names
+
     def _parse_nvidia_smi_line(self, line: str) -> Optional[Dict[str, str]]:
         """
         Parse a line from nvidia-smi -L output.
@@ -543,22 +582,10 @@ class HardwareDetector():
                 else:
                     # Platform-specific detection
                     if platform.system() == "Windows":
-                        try:
-                            # Try PowerShell method first
-                            cpu_info = subprocess.check_output(
-                                'powershell "Get-WmiObject -Class Win32_Processor | Select-Object Name"',
-                                shell=True, text=True, timeout=10
-                            )
-                            if "Intel" in cpu_info:
-                                intel_devices['cpu'] = True
-                        except Exception:
-                            try:
-                                # Fallback to environment variables
-                                cpu_info = subprocess.check_output("echo %PROCESSOR_IDENTIFIER%", shell=True, text=True, timeout=5)
-                                if "Intel" in cpu_info:
-                                    intel_devices['cpu'] = True
-                            except Exception:
-                                pass
+                        # Processor names from WMI, falling back to the environment
+                        cpu_info = self._get_windows_names('Win32_Processor') or os.environ.get('PROCESSOR_IDENTIFIER', '')
+                        if "Intel" in cpu_info:
+                            intel_devices['cpu'] = True
                     else:
                         # Linux/Mac - check /proc/cpuinfo or similar
                         try:
@@ -580,16 +607,8 @@ class HardwareDetector():
         # Check for Intel GPU (basic detection)
         try:
             if platform.system() == "Windows":
-                try:
-                    # Try PowerShell method first
-                    gpu_info = subprocess.check_output(
-                        'powershell "Get-WmiObject -Class Win32_VideoController | Select-Object Name"',
-                        shell=True, text=True, timeout=10
-                    )
-                    if "Intel" in gpu_info:
-                        intel_devices['gpu'] = True
-                except Exception:
-                    pass
+                if "Intel" in self._get_windows_names('Win32_VideoController'):
+                    intel_devices['gpu'] = True
             else:
                 # Linux - check lspci for Intel graphics
                 try:
@@ -617,11 +636,7 @@ class HardwareDetector():
                     # Fallback detection for newer Intel generations
                     if platform.system() == "Windows":
                         try:
-                            # Try PowerShell first
-                            cpu_info = subprocess.check_output(
-                                'powershell "Get-WmiObject -Class Win32_Processor | Select-Object Name"',
-                                shell=True, text=True, timeout=10
-                            )
+                            cpu_info = self._get_windows_names('Win32_Processor')
                             # Look for generation indicators or Intel Core Ultra processors
                             if any(gen in cpu_info for gen in ['12th', '13th', '14th', '15th', 'i3-12', 'i5-12', 'i7-12', 'i9-12', 'i3-13', 'i5-13', 'i7-13', 'i9-13']) or 'Intel(R) Core(TM) Ultra' in cpu_info:
                                 intel_devices['npu'] = True
@@ -667,18 +682,7 @@ class HardwareDetector():
                     }
         
         if platform.system() == "Windows":
-            # Try PowerShell WMI method first
-            gpu_info = self._run_command('powershell "Get-WmiObject -Class Win32_VideoController | Select-Object Name"')
-            if gpu_info:
-                nvidia_count = gpu_info.count("NVIDIA")
-                if nvidia_count > 0:
-                    nvidia_devices['gpu'] = True
-                    nvidia_devices['gpu_count'] = nvidia_count
-                    populate_gpu_details(nvidia_count)
-                    return nvidia_devices
-            
-            # Fallback to alternative PowerShell command
-            gpu_info = self._run_command('powershell "Get-CimInstance -ClassName Win32_VideoController | Select-Object -ExpandProperty Name"')
+            gpu_info = self._get_windows_names('Win32_VideoController')
             if gpu_info:
                 nvidia_count = gpu_info.count("NVIDIA")
                 if nvidia_count > 0:
@@ -738,40 +742,13 @@ class HardwareDetector():
         try:
             # Check CPU vendor
             if platform.system() == "Windows":
-                try:
-                    # Try PowerShell method first
-                    cpu_info = subprocess.check_output(
-                        'powershell "Get-WmiObject -Class Win32_Processor | Select-Object Name"', 
-                        shell=True, text=True
-                    )
-                    if "AMD" in cpu_info:
-                        amd_devices['cpu'] = True
-                    
-                    # Check for AMD GPU
-                    gpu_info = subprocess.check_output(
-                        'powershell "Get-WmiObject -Class Win32_VideoController | Select-Object Name"', 
-                        shell=True, text=True
-                    )
-                    if "AMD" in gpu_info or "Radeon" in gpu_info:
-                        amd_devices['gpu'] = True
-                except Exception:
-                    try:
-                        # Fallback to alternative PowerShell commands
-                        cpu_info = subprocess.check_output(
-                            'powershell "Get-CimInstance -ClassName Win32_Processor | Select-Object -ExpandProperty Name"', 
-                            shell=True, text=True
-                        )
-                        if "AMD" in cpu_info:
-                            amd_devices['cpu'] = True
-                        
-                        gpu_info = subprocess.check_output(
-                            'powershell "Get-CimInstance -ClassName Win32_VideoController | Select-Object -ExpandProperty Name"', 
-                            shell=True, text=True
-                        )
-                        if "AMD" in gpu_info or "Radeon" in gpu_info:
-                            amd_devices['gpu'] = True
-                    except Exception:
-                        pass
+                if "AMD" in self._get_windows_names('Win32_Processor'):
+                    amd_devices['cpu'] = True
+                
+                # Check for AMD GPU
+                gpu_info = self._get_windows_names('Win32_VideoController')
+                if "AMD" in gpu_info or "Radeon" in gpu_info:
+                    amd_devices['gpu'] = True
             else:
                 # Linux/Mac
                 try:
@@ -841,22 +818,10 @@ class HardwareDetector():
         # Platform-specific detection
         try:
             if platform.system() == "Windows":
-                try:
-                    # Try PowerShell method first
-                    cpu_info = subprocess.check_output(
-                        'powershell "Get-WmiObject -Class Win32_Processor | Select-Object Name"',
-                        shell=True, text=True, timeout=10
-                    )
-                    if "Intel" in cpu_info:
-                        return True
-                except Exception:
-                    try:
-                        # Fallback to environment variables
-                        cpu_info = subprocess.check_output("echo %PROCESSOR_IDENTIFIER%", shell=True, text=True, timeout=5)
-                        if "Intel" in cpu_info:
-                            return True
-                    except Exception:
-                        pass
+                # Processor names from WMI, falling back to the environment
+                cpu_info = self._get_windows_names('Win32_Processor') or os.environ.get('PROCESSOR_IDENTIFIER', '')
+                if "Intel" in cpu_info:
+                    return True
             else:
                 # Linux/Mac - check /proc/cpuinfo or similar
                 try:
@@ -163,6 +163,7 @@ class InferenceNode:
         
         # Node capabilities and info (hardware detector is now available)
         self.node_info = self._get_node_capabilities()
+        self._node_info_body = None  # Serialized /api/info response, see _node_info_updated
         
         # Set node info in discovery manager for broadcasting
         if self.discovery_manager:
@@ -197,8 +198,13 @@ class InferenceNode:
             self.node_info['pipeline_stats'] = stats
             
             # Update discovery manager with new info if it's running
-            if self.discovery_manager and self.node_id:
-                self.discovery_manager.set_node_info(self.node_id, self.node_info)
+            self._node_info_updated()
+    
+    def _node_info_updated(self):
+        """Call after changing node_info: drops the cached /api/info body and updates discovery"""
+        self._node_info_body = None
+        if self.discovery_manager and self.node_id:
+            self.discovery_manager.set_node_info(self.node_id, self.node_info)
     
     def _get_node_capabilities(self) -> Dict[str, Any]:
         """Get node hardware capabilities"""
@@ -317,7 +323,11 @@ class InferenceNode:
         @self.app.route('/api/info', methods=['GET'])
         def get_node_info():
             """Get node information and capabilities"""
-            return jsonify(self.node_info)
+            # Polled by every discovering peer; serialized once per node_info change
+            body = self._node_info_body
+            if body is None:
+                body = self._node_info_body = jsonify(self.node_info).get_data()
+            return Response(body, mimetype='application/json')
         
         # Logs API Routes
         @self.app.route('/api/logs', methods=['GET'])
@@ -508,8 +518,7 @@ class InferenceNode:
                     
                     # Update node info for discovery
                     self.node_info['node_name'] = self.node_name
-                    if self.discovery_manager:
-                        self.discovery_manager.set_node_info(self.node_id, self.node_info)
+                    self._node_info_updated()
                 
                 # Update log level if provided
                 if 'log_level' in data and self.log_manager:
@@ -3196,7 +3205,7 @@ class InferenceNode:
                             # Restore the ID if it exists
                             if 'id' in pub_config:
                                 destination._id = pub_config['id']
-                                self.result_publisher.destinations.append(destination)
+                                self.result_publisher.add(destination)
                                 self.logger.info(f"[OK] Successfully restored publisher: {destination_type} with ID: {pub_config['id']}")
                             else:
                                 # Generate new ID for legacy publishers without IDs
@@ -3466,6 +3475,10 @@ class InferenceNode:
         if self.telemetry:
             self.telemetry.stop_telemetry()
         
+        # Persist any pending pipeline metadata changes and stop the writer thread
+        if self.pipeline_manager:
+            self.pipeline_manager.shutdown()
+        
         # Clear publishers
         self.result_publisher.clear()
         
@@ -5,6 +5,7 @@ import threading
 import uuid
 import time
 import json
+import logging
 import cv2
 from typing import Dict, Any, Optional
 
@@ -15,21 +16,29 @@ from InferenceEngine import InferenceEngineFactory
 from frame_source.video_capture_base import VideoCaptureBase
 from InferenceEngine.engines.base_engine import BaseInferenceEngine
 from ResultPublisher import ResultPublisher
-from ResultPublisher.result_destinations import MQTTDestination
+
+# Cap OpenCV's internal thread pool so it doesn't oversubscribe cores used by the inference engine.
+# The setting is process-wide, so it is applied once here rather than per pipeline.
+OPENCV_NUM_THREADS = 2
+cv2.setNumThreads(OPENCV_NUM_THREADS)
+
+logger = logging.getLogger(__name__)
 
 
 class InferencePipeline:
     def __init__(self) -> None:
         self.id = str(uuid.uuid4())
         self.nodes = []
-        self.source : VideoCaptureBase
+        self.source : Optional[VideoCaptureBase] = None
         self.inference_engine : BaseInferenceEngine
         self.result_publisher : ResultPublisher
+        self.thread : Optional[threading.Thread] = None
         self._stop_requested = False  # Flag to control pipeline execution
         self._latest_frame = None  # Store latest processed frame for streaming
         self._inference_enabled = True  # Flag to enable/disable inference processing
 
         self._frame_lock = threading.Lock()  # Thread-safe access to latest frame
+        self._new_frame_cv = threading.Condition(self._frame_lock)  # Notified whenever _latest_frame is replaced
 
         self._frame_counter = 0  # Count processed frames
         self._inference_counter = 0  # Count inferences performed
@@ -55,7 +64,11 @@ class InferencePipeline:
         self._is_initialized = False  # True when configured and model is loaded
         self._is_running = False  # True when pipeline thread is actively running
         self._error_state = None  # None if no error, otherwise contains error message
+        self._stopped_callbacks = []  # Called (no args) from the run thread when the run loop exits
         self._is_streaming = False  # True when streaming is active
+        
+        # Optional set of CPU cores to pin the pipeline thread to (Linux only)
+        self._cpu_affinity = None
 
     def __str__(self) -> str:
         return f"InferencePipeline(id={self.id}, source={self.source}, inference_engine={self.inference_engine}, result_publisher={self.result_publisher})"
@@ -95,6 +108,10 @@ class InferencePipeline:
         """Check if pipeline is currently running"""
         return self._is_running
     
+    def on_stopped(self, callback):
+        """Register a callable invoked from the run thread whenever the run loop exits"""
+        self._stopped_callbacks.append(callback)
+    
     def has_error(self) -> bool:
         """Check if pipeline is in error state"""
         return self._error_state is not None
@@ -145,6 +162,26 @@ class InferencePipeline:
             "error": state['error'],
         }
     
+    def get_performance(self) -> Dict[str, float]:
+        """
+        Get just the rolling FPS and inference latency (cheaper than get_metrics for aggregate stats).
+        """
+        return {
+            "fps": self._calculate_rolling_fps(time.perf_counter()),
+            "latency_ms": self._calculate_rolling_latency(),
+        }
+    
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Get metrics and publisher states together in a single call
+        
+        Returns:
+            Dictionary with 'metrics' (see get_metrics) and 'publisher_states' (see get_publisher_states)
+        """
+        return {
+            'metrics': self.get_metrics(),
+            'publisher_states': self.get_publisher_states(),
+        }
+
     def _calculate_rolling_fps(self, current_time: float) -> float:
         """
         Calculate FPS over the last 10 seconds using a rolling window.
@@ -199,7 +236,7 @@ class InferencePipeline:
 
     def disable_publisher(self, id: str = 'all'):
         """Disable a specific result publisher by ID or all publishers"""
-        print(f"DEBUG: disable_publisher called with id='{id}'")
+        logger.debug("Pipeline %s: disable_publisher called with id=%r", self.id, id)
         if id == 'all':
             for rp in self.result_publisher.destinations:
                 rp.enabled = False
@@ -207,9 +244,12 @@ class InferencePipeline:
             return
 
         if self.result_publisher:
-            print(f"DEBUG: Looking for publisher with id='{id}' among {len(self.result_publisher.destinations)} destinations")
-            for i, dest in enumerate(self.result_publisher.destinations):
-                print(f"DEBUG: Destination {i}: _id='{getattr(dest, '_id', 'NO_ID')}', enabled={getattr(dest, 'enabled', 'NO_ENABLED')}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Pipeline %s: looking for publisher id=%r among %d destinations",
+                             self.id, id, len(self.result_publisher.destinations))
+                for i, dest in enumerate(self.result_publisher.destinations):
+                    logger.debug("Destination %d: _id=%r, enabled=%s",
+                                 i, getattr(dest, '_id', None), getattr(dest, 'enabled', None))
             
             rp = self.result_publisher.get_by_id(id)
             if rp:
@@ -222,7 +262,7 @@ class InferencePipeline:
 
     def enable_publisher(self, id: str = 'all'):
         """Enable a specific result publisher by ID or all publishers"""
-        print(f"DEBUG: enable_publisher called with id='{id}'")
+        logger.debug("Pipeline %s: enable_publisher called with id=%r", self.id, id)
         if id == 'all':
             for rp in self.result_publisher.destinations:
                 rp.enabled = True
@@ -235,9 +275,12 @@ class InferencePipeline:
             return
 
         if self.result_publisher:
-            print(f"DEBUG: Looking for publisher with id='{id}' among {len(self.result_publisher.destinations)} destinations")
-            for i, dest in enumerate(self.result_publisher.destinations):
-                print(f"DEBUG: Destination {i}: _id='{getattr(dest, '_id', 'NO_ID')}', enabled={getattr(dest, 'enabled', 'NO_ENABLED')}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Pipeline %s: looking for publisher id=%r among %d destinations",
+                             self.id, id, len(self.result_publisher.destinations))
+                for i, dest in enumerate(self.result_publisher.destinations):
+                    logger.debug("Destination %d: _id=%r, enabled=%s",
+                                 i, getattr(dest, '_id', None), getattr(dest, 'enabled', None))
             
             rp = self.result_publisher.get_by_id(id)
             if rp:
@@ -416,9 +459,11 @@ class InferencePipeline:
     
     def set_thumbnail_path(self, thumbnail_dir: str):
         """Set the directory where thumbnails will be saved"""
-        if not os.path.exists(thumbnail_dir):
-            os.makedirs(thumbnail_dir, exist_ok=True)
-        self._thumbnail_path = os.path.join(thumbnail_dir, f"thumbnail_{self.id}.jpg")
+        thumbnail_path = os.path.join(thumbnail_dir, f"thumbnail_{self.id}.jpg")
+        if thumbnail_path == self._thumbnail_path:
+            return  # Already set up - skip the directory check
+        os.makedirs(thumbnail_dir, exist_ok=True)
+        self._thumbnail_path = thumbnail_path
     
     def capture_thumbnail(self, frame):
         """Capture a thumbnail from the current frame"""
@@ -475,6 +520,13 @@ class InferencePipeline:
         self._is_running = True
         self._error_state = None  # Clear any previous errors
         
+        # Pin this thread to the requested cores (pid 0 targets the calling thread on Linux)
+        if self._cpu_affinity and hasattr(os, 'sched_setaffinity'):
+            try:
+                os.sched_setaffinity(0, self._cpu_affinity)
+            except OSError as e:
+                print(f"Pipeline {self.id}: Could not set CPU affinity {self._cpu_affinity}: {e}")
+        
         try:
             self.source.connect()
             print(f"Pipeline {self.id}: Frame source connected successfully")
@@ -567,11 +619,16 @@ class InferencePipeline:
                     json_results = self.inference_engine.result_to_json(results)
                     # print(json_results)
 
-                    if self.result_publisher.do_any_destinations_need_result_image() or self._is_streaming:
+                    # Evaluate destination requirements once per frame (each check takes the publisher lock)
+                    need_image = self.result_publisher.do_any_destinations_need_image()
+                    need_result_image = self.result_publisher.do_any_destinations_need_result_image()
+
+                    if need_result_image or self._is_streaming:
                         # Draw results on frame and store for streaming or publishing
                         with self._frame_lock:
                             output = self.inference_engine.draw(frame, results)
                             self._latest_frame = output.copy()
+                            self._new_frame_cv.notify_all()
                         
                             # Capture thumbnail on first successful inference (with drawn results)
                             if not self._thumbnail_captured and self._thumbnail_path:
@@ -580,6 +637,7 @@ class InferencePipeline:
                         # Store raw frame without drawing (for quick preview when streaming starts)
                         with self._frame_lock:
                             self._latest_frame = frame.copy()
+                            self._new_frame_cv.notify_all()
                             
                             # Capture thumbnail on first successful frame if needed
                             if not self._thumbnail_captured and self._thumbnail_path:
@@ -588,6 +646,7 @@ class InferencePipeline:
                     # If no results, store the original frame for streaming
                     with self._frame_lock:
                         self._latest_frame = frame.copy()
+                        self._new_frame_cv.notify_all()
                         
                         # Capture thumbnail on first successful frame (original frame if no inference)
                         if not self._thumbnail_captured and self._thumbnail_path:
@@ -600,8 +659,8 @@ class InferencePipeline:
 
                     # Publish results
                     self.result_publisher.publish(to_publish, 
-                                                  frame if self.result_publisher.do_any_destinations_need_image() else None,
-                                                  self._latest_frame if self.result_publisher.do_any_destinations_need_result_image() else None)
+                                                  frame if need_image else None,
+                                                  self._latest_frame if need_result_image else None)
                 
                 # Auto-delete the processed image if enabled
                 self._delete_current_image()
@@ -616,12 +675,24 @@ class InferencePipeline:
         finally:
             # Mark as not running
             self._is_running = False
-            # Stop the video capture
-            if hasattr(self, 'source') and self.source:
-                self.source.stop()
+            # Stop the video capture; a failure here must not skip the stopped callbacks below,
+            # since the pipeline manager waits on them to clean up
+            if self.source is not None:
+                try:
+                    self.source.stop()
+                except Exception as e:
+                    print(f"Pipeline {self.id}: Error stopping source: {e}")
             print(f"Pipeline {self.id} run loop ended")
+            for callback in self._stopped_callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Pipeline {self.id}: Error in stopped callback: {e}")
+
+    def configure(self, frame_source_config, inference_engine_config, result_publisher: ResultPublisher,
+                  cpu_affinity: Optional[set] = None):
 
-    def configure(self, frame_source_config, inference_engine_config, result_publisher: ResultPublisher):
+        self._cpu_affinity = set(cpu_affinity) if cpu_affinity else None
 
         self._frame_source_config = frame_source_config  # Store for auto-delete functionality
         # self.frame_source_config = frame_source_config
@@ -667,26 +738,33 @@ class InferencePipeline:
         """
         print(f"Stopping pipeline {self.id}")
         self._stop_requested = True  # Signal the run loop to stop
+        
+        # Give the thread some time to stop gracefully
+        thread_stopped = True
+        if self.thread is not None and self.thread.is_alive():
+            self.thread.join(timeout=5.0)  # Wait up to 5 seconds
+            if self.thread.is_alive():
+                thread_stopped = False
+                print(f"Warning: Pipeline {self.id} thread did not stop within timeout")
+        
         self._is_streaming = False  # Reset streaming flag when pipeline stops
         
-        # Update thumbnail with the last received frame before stopping
+        # Update thumbnail with the last received frame
         if self._latest_frame is not None and self._thumbnail_path:
             try:
-                with self._frame_lock:
-                    last_frame = self._latest_frame.copy()
+                if thread_stopped:
+                    # Run loop has exited so nothing else writes _latest_frame - no lock or copy needed
+                    last_frame = self._latest_frame
+                else:
+                    with self._frame_lock:
+                        last_frame = self._latest_frame.copy()
                 self.capture_thumbnail(last_frame)
                 print(f"Pipeline {self.id}: Updated thumbnail with last frame before stopping")
             except Exception as e:
                 print(f"Pipeline {self.id}: Failed to update thumbnail with last frame: {e}")
         
-        # Give the thread some time to stop gracefully
-        if hasattr(self, 'thread') and self.thread and self.thread.is_alive():
-            self.thread.join(timeout=5.0)  # Wait up to 5 seconds
-            if self.thread.is_alive():
-                print(f"Warning: Pipeline {self.id} thread did not stop within timeout")
-        
         # Ensure source is stopped
-        if hasattr(self, 'source') and self.source:
+        if self.source is not None:
             try:
                 self.source.stop()
             except Exception as e:
@@ -702,6 +780,16 @@ class InferencePipeline:
         with self._frame_lock:
             return self._latest_frame.copy() if self._latest_frame is not None else None
 
+    def wait_for_new_frame(self, timeout: Optional[float] = None):
+        """Block until the run loop produces a new frame, then return a copy of it
+        
+        Returns None if no new frame arrived within the timeout.
+        """
+        with self._new_frame_cv:
+            if not self._new_frame_cv.wait(timeout) or self._latest_frame is None:
+                return None
+            return self._latest_frame.copy()
+
     def start_streaming(self):
         """Enable streaming flag to indicate frames should be drawn with results"""
         self._is_streaming = True
@@ -727,6 +815,7 @@ class InferencePipeline:
 
 def main():
     import cv2
+    from ResultPublisher.result_destinations import MQTTDestination
 
     mqtt_destination = MQTTDestination()
     mqtt_destination.configure(server='192.168.1.241', port=1883, topic='inference/results', rate_limit=0.1)
@@ -753,7 +842,7 @@ def main():
     pipeline.start()
 
     while True:
-        frame = pipeline.get_latest_frame()
+        frame = pipeline.wait_for_new_frame(timeout=0.1)
         if frame is not None:
             cv2.imshow(f"Pipeline {pipeline.id}", frame)
         if cv2.waitKey(1) & 0xFF == ord('q'):
@@ -6,18 +6,124 @@ import threading
 import uuid
 import json
 import time
+import hashlib
 import logging
+import functools
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
+try:
+    import orjson  # Optional fast JSON (de)serializer for pipeline metadata
+except ImportError:
+    orjson = None
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ResultPublisher import ResultPublisher
+from ResultPublisher import ResultPublisher, BaseResultDestination, _destination_class
 from .pipeline import InferencePipeline
 
+@functools.lru_cache(maxsize=1)
+def _openvino_devices() -> Optional[tuple]:
+    """Devices reported by OpenVINO, probed once per process; None if OpenVINO is not installed"""
+    try:
+        from openvino.runtime import Core
+    except ImportError:
+        return None
+    return tuple(Core().available_devices)
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_available() -> Optional[bool]:
+    """Whether PyTorch can see a CUDA device, checked once per process; None if PyTorch is not installed"""
+    try:
+        import torch
+    except ImportError:
+        return None
+    return torch.cuda.is_available()
+
+
+def _atomic_write_bytes(path: str, data: bytes):
+    """Write data to path via a temp file and os.replace, so readers never see a partial file"""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    # Make the rename itself durable (directories can't be opened for fsync on Windows)
+    if hasattr(os, 'O_DIRECTORY'):
+        try:
+            dir_fd = os.open(os.path.dirname(path) or '.', os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
+# UI capture types that differ from the FrameSourceFactory type names
+_CAPTURE_TYPE_MAPPING = MappingProxyType({
+    'ip_camera': 'ipcam',  # UI uses 'ip_camera', FrameSourceFactory expects 'ipcam'
+    'image_folder': 'folder',  # UI uses 'image_folder', FrameSourceFactory expects 'folder'
+    # Add other mappings as needed
+})
+
+# Capture types (UI and factory names) that read images from a folder
+_FOLDER_CAPTURE_TYPES = frozenset({'image_folder', 'folder'})
+
+# Device validation in _initialize_pipeline: engines running on OpenVINO and the device names they accept,
+# and device names that ask PyTorch-based engines for CUDA (bare GPU indices like '1' are checked separately)
+_OPENVINO_ENGINES = frozenset({'geti'})
+_OPENVINO_GPU_DEVICES = frozenset({'gpu', 'intel:gpu'})
+_OPENVINO_CPU_DEVICES = frozenset({'cpu', 'intel:cpu'})
+_CUDA_DEVICES = frozenset({'cuda', '0', 'gpu', 'nvidia:gpu'})
+
+# Optional pipeline methods the manager calls; probed once per pipeline class (see _pipeline_capabilities)
+_PIPELINE_METHODS = (
+    'get_snapshot', 'get_metrics', 'get_performance', 'get_publisher_states', 'is_running', 'stop',
+    'enable_inference', 'disable_inference', 'enable_publisher', 'disable_publisher',
+    'get_latest_frame', 'set_thumbnail_path', 'capture_thumbnail',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _pipeline_capabilities(pipeline_class: type) -> Dict[str, bool]:
+    """Which of _PIPELINE_METHODS a pipeline class provides"""
+    return {name: hasattr(pipeline_class, name) for name in _PIPELINE_METHODS}
+
+
+# Destination types a pipeline can publish to: type -> (class name, display name, config summary for logging).
+# Classes are resolved by name so only the plugins a pipeline uses get imported.
+_DEST_REGISTRY = {
+    'mqtt': ('MQTTDestination', 'MQTT', lambda cfg: cfg.get('server', 'unknown')),
+    'webhook': ('WebhookDestination', 'Webhook', lambda cfg: cfg.get('url', 'unknown')),
+    'null': ('NullDestination', 'Null', lambda cfg: ''),
+    'serial': ('SerialDestination', 'Serial', lambda cfg: cfg.get('com_port', 'unknown')),
+    'folder': ('FolderDestination', 'File', lambda cfg: cfg.get('folder_path', 'unknown')),
+    'roboflow': ('RoboflowDestination', 'Roboflow',
+                 lambda cfg: f"{cfg.get('workspace_id', 'unknown')}/{cfg.get('project_id', 'unknown')}"),
+    'geti': ('GetiDestination', 'Geti',
+             lambda cfg: f"{cfg.get('host', 'unknown')} -> {cfg.get('project_name') or cfg.get('project_id', 'unknown')}"),
+}
+
 class PipelineManager:
     """Manages inference pipelines and their execution"""
 
+    # Pipeline metadata fields returned by list_pipelines()
+    LIST_FIELDS = ('id', 'name', 'description', 'status', 'model', 'frame_source', 'destinations',
+                   'created_date', 'modified_date', 'inference_enabled', 'stats')
+
     def __init__(self, repo_path: str, node_id: Optional[str] = None, node_name: Optional[str] = None):
         self.repo_path = repo_path
         
@@ -35,6 +141,10 @@ class PipelineManager:
         self.active_pipelines = {}  # Dict[str, Dict] - pipeline_info
         self.pipeline_threads = {}  # Dict[str, threading.Thread]
         
+        # Guards metadata, active_pipelines and pipeline_threads across API and pipeline threads.
+        # Never held while waiting on pipeline threads or calling into pipeline instances.
+        self._lock = threading.RLock()
+        
         # Store node info for context variables in destinations
         self.node_id = node_id
         self.node_name = node_name
@@ -42,36 +152,79 @@ class PipelineManager:
         # Set up logger
         self.logger = logging.getLogger(__name__)
         
+        # Metadata writes are debounced: _save_metadata() only marks the metadata dirty and
+        # a background flusher coalesces bursts of changes into a single file write
+        self._metadata_lock = threading.Lock()
+        self._metadata_dirty = threading.Event()
+        self._metadata_flush_delay = 0.1  # seconds to wait for further changes before writing
+        self._metadata_flusher_stop = False
+        self._metadata_flusher = threading.Thread(target=self._metadata_flush_loop, daemon=True,
+                                                  name="PipelineMetadataFlusher")
+        self._metadata_flusher.start()
+        
+        # Short-lived cache of list_pipelines() output; UI and discovery poll it frequently
+        self._list_cache: Optional[Dict[str, Any]] = None
+        self._list_cache_ts = 0.0
+        self._list_cache_ttl = 0.5  # seconds
+        # Bumped on every invalidation; a result built across a change is not cached
+        self._cache_generation = 0
+        
+        # Short-lived cache of get_pipeline_stats() output, polled by the dashboard
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_ts = 0.0
+        self._stats_cache_ttl = 1.0  # seconds
+        
+        # Thumbnail presence per pipeline: pipeline_id -> (checked_at, path or None).
+        # Negative results are cached too; entries are dropped whenever a thumbnail is written or deleted
+        self._thumbnail_cache: Dict[str, tuple] = {}
+        self._thumbnail_cache_ttl = 2.0  # seconds
+        
         # Create directories if they don't exist
         os.makedirs(self.pipelines_base_dir, exist_ok=True)
         os.makedirs(self.thumbnails_dir, exist_ok=True)
         
         # Load existing metadata
         self.metadata = self._load_metadata()
+        
+        # Per-pipeline index of destination dicts by ID (references into self.metadata)
+        self._dest_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for pipeline_id in self.metadata:
+            self._rebuild_dest_index(pipeline_id)
+        
         # Reset all pipeline statuses to 'stopped' on startup
         # (pipelines don't support auto-run on system start yet)
-        for pipeline_id, pipeline_data in self.metadata.items():
+        statuses_changed = False
+        for pipeline_data in self.metadata.values():
             if pipeline_data.get('status') != 'stopped':
                 pipeline_data['status'] = 'stopped'
+                statuses_changed = True
         
         # Clear any stale active pipeline entries on startup
         self.active_pipelines.clear()
         self.pipeline_threads.clear()
                 
-        # Save the updated metadata
-        self._save_metadata()
+        # Save the updated metadata (nothing to write after a clean shutdown)
+        if statuses_changed:
+            self._save_metadata()
         
     
     def _cleanup_stale_pipeline_state(self, pipeline_id: str):
         """Clean up stale pipeline state entries"""
-        if pipeline_id in self.active_pipelines:
-            del self.active_pipelines[pipeline_id]
-        if pipeline_id in self.pipeline_threads:
-            del self.pipeline_threads[pipeline_id]
-        # Also update metadata status
-        if pipeline_id in self.metadata:
-            self.metadata[pipeline_id]['status'] = 'stopped'
-            self._save_metadata()
+        with self._lock:
+            self._remove_active_pipeline(pipeline_id)
+            self.pipeline_threads.pop(pipeline_id, None)
+            # Also update metadata status
+            meta = self.metadata.get(pipeline_id)
+            if meta is not None:
+                meta['status'] = 'stopped'
+                self._save_metadata()
+
+    def _remove_active_pipeline(self, pipeline_id: str):
+        """Drop a pipeline's runtime entry and wake its supervisor thread"""
+        with self._lock:
+            active_pipeline = self.active_pipelines.pop(pipeline_id, None)
+        if active_pipeline is not None and 'stop_event' in active_pipeline:
+            active_pipeline['stop_event'].set()
 
     def get_pipeline_status(self, pipeline_id: str) -> Optional[dict]:
         """Get the full status of the pipeline for API reporting."""
@@ -88,7 +241,7 @@ class PipelineManager:
 
         # Get metrics
         stats = pipeline.get('stats', {})
-        if pipeline_instance and hasattr(pipeline_instance, 'get_metrics'):
+        if pipeline_instance and runtime['caps']['get_metrics']:
             try:
                 stats = pipeline_instance.get_metrics()
             except Exception:
@@ -117,19 +270,92 @@ class PipelineManager:
         """Load pipeline metadata from file"""
         if os.path.exists(self.metadata_file):
             try:
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
+                # Read the whole file in one call and parse the bytes directly
+                with open(self.metadata_file, 'rb') as f:
+                    data = f.read()
+                if orjson is not None:
+                    return orjson.loads(data)
+                return json.loads(data)
             except Exception as e:
                 print(f"Warning: Could not load pipeline metadata: {e}")
         return {}
     
     def _save_metadata(self):
+        """Mark pipeline metadata as changed; the background flusher writes it to file"""
+        self._invalidate_list_cache()
+        self._metadata_dirty.set()
+    
+    def _invalidate_list_cache(self):
+        """Drop the cached list_pipelines() and get_pipeline_stats() results after a pipeline change"""
+        with self._lock:
+            self._cache_generation += 1
+            self._list_cache = None
+            self._stats_cache = None
+    
+    def flush_metadata(self):
+        """Write any pending metadata changes to file immediately (e.g. on shutdown)"""
+        if self._metadata_dirty.is_set():
+            self._metadata_dirty.clear()
+            self._flush_metadata_to_disk()
+    
+    def _metadata_flush_loop(self):
+        """Background loop that coalesces metadata changes into debounced writes"""
+        while not self._metadata_flusher_stop:
+            self._metadata_dirty.wait()
+            if self._metadata_flusher_stop:
+                break
+            # Let a burst of changes settle so they land in one write
+            time.sleep(self._metadata_flush_delay)
+            self._metadata_dirty.clear()
+            self._flush_metadata_to_disk()
+    
+    def shutdown(self, timeout: float = 5.0):
+        """Stop the background metadata writer and write any pending changes"""
+        self._metadata_flusher_stop = True
+        self._metadata_dirty.set()  # Wake the flusher so it can exit
+        if self._metadata_flusher.is_alive():
+            self._metadata_flusher.join(timeout=timeout)
+        self._flush_metadata_to_disk()
+    
+    def _flush_metadata_to_disk(self):
         """Save pipeline metadata to file"""
-        try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
-        except Exception as e:
-            print(f"Error saving pipeline metadata: {e}")
+        with self._metadata_lock:
+            try:
+                # Serialize up front so the file is written with a single write() call.
+                # The file is machine-read, so it is only pretty-printed when debug logging is on.
+                with self._lock:
+                    data = self._dump_metadata(pretty=self.logger.isEnabledFor(logging.DEBUG))
+                _atomic_write_bytes(self.metadata_file, data)
+            except Exception as e:
+                print(f"Error saving pipeline metadata: {e}")
+    
+    def _dump_metadata(self, pretty: bool = False) -> bytes:
+        """Serialize pipeline metadata to JSON bytes, using orjson when available"""
+        if orjson is not None:
+            # OPT_NON_STR_KEYS matches the json module, which stringifies int/float keys instead of raising
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            return orjson.dumps(self.metadata, option=option)
+        if pretty:
+            return json.dumps(self.metadata, indent=2).encode('utf-8')
+        return json.dumps(self.metadata, separators=(',', ':')).encode('utf-8')
+    
+    def _rebuild_dest_index(self, pipeline_id: str):
+        """Rebuild the destination-by-ID index for a pipeline from its metadata"""
+        pipeline_data = self.metadata.get(pipeline_id)
+        if pipeline_data is None:
+            self._dest_index.pop(pipeline_id, None)
+            return
+        self._dest_index[pipeline_id] = {
+            str(dest.get('id')): dest for dest in reversed(pipeline_data.get('destinations', [])) if dest.get('id')
+        }
+    
+    @staticmethod
+    def _config_key(config: Any) -> str:
+        """Stable string form of a destination config, used to match configs by value"""
+        if orjson is not None:
+            return orjson.dumps(config, default=str,
+                                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        return json.dumps(config, sort_keys=True, separators=(',', ':'), default=str)
     
     def _ensure_destination_uuid(self, dest_id: str) -> str:
         """Convert frontend destination ID to a proper UUID format"""
@@ -137,21 +363,25 @@ class PipelineManager:
             return str(uuid.uuid4())
         
         # If it's already a valid UUID format, return as-is
-        try:
-            uuid.UUID(dest_id)
-            return dest_id
-        except ValueError:
-            # Convert frontend ID to a consistent UUID
-            # Use a hash of the original ID to ensure consistency
-            import hashlib
-            hash_object = hashlib.md5(dest_id.encode())
-            hex_dig = hash_object.hexdigest()
-            # Convert to UUID format
-            return f"{hex_dig[:8]}-{hex_dig[8:12]}-{hex_dig[12:16]}-{hex_dig[16:20]}-{hex_dig[20:32]}"
+        # (cheap shape check first so typical frontend IDs skip uuid.UUID's parse-and-raise path)
+        if len(dest_id) == 36 and dest_id[8] == '-' and dest_id[13] == '-' and dest_id[18] == '-' and dest_id[23] == '-':
+            try:
+                uuid.UUID(dest_id)
+                return dest_id
+            except ValueError:
+                pass
+        
+        # Convert frontend ID to a consistent UUID
+        # Use a hash of the original ID to ensure consistency
+        hash_object = hashlib.md5(dest_id.encode())
+        hex_dig = hash_object.hexdigest()
+        # Convert to UUID format
+        return f"{hex_dig[:8]}-{hex_dig[8:12]}-{hex_dig[12:16]}-{hex_dig[16:20]}-{hex_dig[20:32]}"
 
     def create_pipeline(self, config: Dict[str, Any]) -> str:
         """Create a new pipeline configuration"""
         pipeline_id = str(uuid.uuid4())
+        now_iso = datetime.now().isoformat()
         
         # Process destinations to ensure they have enabled state and unique IDs
         processed_destinations = []
@@ -173,11 +403,12 @@ class PipelineManager:
             'name': config['name'],
             'description': config.get('description', ''),
             'frame_source': config['frame_source'],
-            'model': config['model'],
+            'model': self._normalize_model_config(config['model']),
             'destinations': processed_destinations,
-            'created_date': datetime.now().isoformat(),
+            'created_date': now_iso,
             'status': 'stopped',
             'inference_enabled': config.get('inference_enabled', True),  # Default to enabled
+            'cpu_affinity': config.get('cpu_affinity'),  # Optional cores to pin the pipeline thread to
             'stats': {
                 'frame_count': 0,
                 'inference_count': 0,
@@ -187,93 +418,157 @@ class PipelineManager:
         }
         
         # Save to metadata
-        self.metadata[pipeline_id] = pipeline_data
-        self._save_metadata()
+        with self._lock:
+            self.metadata[pipeline_id] = pipeline_data
+            self._rebuild_dest_index(pipeline_id)
+            self._save_metadata()
         
         return pipeline_id
     
+    @staticmethod
+    def _parse_cpu_affinity(pipeline_id: str, cpu_affinity: Any) -> Optional[set]:
+        """Parse a pipeline's 'cpu_affinity' (list of core ids or "0,2,3" string) into a set, None if unset or invalid"""
+        if not cpu_affinity:
+            return None
+        if isinstance(cpu_affinity, str):
+            cpu_affinity = [core for core in cpu_affinity.split(',') if core.strip()]
+        try:
+            cores = {int(core) for core in cpu_affinity}
+        except (TypeError, ValueError):
+            print(f"Pipeline {pipeline_id}: Ignoring invalid cpu_affinity {cpu_affinity!r}")
+            return None
+        return cores or None
+    
+    @staticmethod
+    def _normalize_model_config(model_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a pipeline's model config with 'precision' ('fp32' or 'int8') normalized for storage"""
+        model_config = dict(model_config)
+        precision = str(model_config.get('precision') or 'fp32').lower()
+        model_config['precision'] = precision if precision in ('fp32', 'int8') else 'fp32'
+        return model_config
+    
     def get_pipeline(self, pipeline_id: str) -> Optional[Dict[str, Any]]:
         """Get pipeline configuration"""
         return self.metadata.get(pipeline_id)
     
     def list_pipelines(self) -> Dict[str, Any]:
-        """List all pipelines with current metrics"""
+        """List all pipelines with current metrics
+        
+        Results are cached for a short TTL and invalidated on any pipeline change;
+        the returned dict must be treated as read-only.
+        """
+        now = time.monotonic()
+        cached = self._list_cache
+        if cached is not None and now - self._list_cache_ts < self._list_cache_ttl:
+            return cached
+        
         pipelines_with_metrics = {}
         
-        for pipeline_id, pipeline_data in self.metadata.items():
-            # Create a copy of the pipeline data
-            pipeline_copy = pipeline_data.copy()
+        # Snapshot under the lock; pipeline instances are queried without holding it
+        with self._lock:
+            generation = self._cache_generation
+            pipeline_items = list(self.metadata.items())
+            active_pipelines = dict(self.active_pipelines)
+        
+        for pipeline_id, pipeline_data in pipeline_items:
+            # Project the listed fields into a new dict (nested values are shared, not copied)
+            pipeline_copy = {key: pipeline_data[key] for key in self.LIST_FIELDS if key in pipeline_data}
             
             # If pipeline is running, get real-time metrics and publisher states
-            if pipeline_id in self.active_pipelines and 'pipeline_instance' in self.active_pipelines[pipeline_id]:
-                pipeline_instance = self.active_pipelines[pipeline_id]['pipeline_instance']
+            active_pipeline = active_pipelines.get(pipeline_id)
+            pipeline_instance = active_pipeline.get('pipeline_instance') if active_pipeline else None
+            if pipeline_instance is not None:
+                caps = active_pipeline['caps']
                 
-                # Get real-time metrics
-                if hasattr(pipeline_instance, 'get_metrics'):
+                # Get real-time metrics and publisher states in one call where supported
+                current_metrics = None
+                publisher_states = None
+                if caps['get_snapshot']:
                     try:
-                        current_metrics = pipeline_instance.get_metrics()
-                        # Update the stats with real-time data
-                        pipeline_copy['stats'] = {
-                            'frame_count': current_metrics.get('frame_count', 0),
-                            'inference_count': current_metrics.get('inference_count', 0),
-                            'fps': round(current_metrics.get('fps', 0), 1),
-                            'latency_ms': round(current_metrics.get('latency_ms', 0), 1),
-                            'elapsed_time': round(current_metrics.get('elapsed_time', 0), 1)
-                        }
-                        # Add uptime to the pipeline data
-                        pipeline_copy['uptime'] = current_metrics.get('uptime', '0s')
+                        snapshot = pipeline_instance.get_snapshot()
+                        current_metrics = snapshot['metrics']
+                        publisher_states = snapshot['publisher_states']
                     except Exception as e:
-                        print(f"Error getting metrics for pipeline {pipeline_id}: {e}")
+                        print(f"Error getting snapshot for pipeline {pipeline_id}: {e}")
+                else:
+                    if caps['get_metrics']:
+                        try:
+                            current_metrics = pipeline_instance.get_metrics()
+                        except Exception as e:
+                            print(f"Error getting metrics for pipeline {pipeline_id}: {e}")
+                    if caps['get_publisher_states']:
+                        try:
+                            publisher_states = pipeline_instance.get_publisher_states()
+                        except Exception as e:
+                            print(f"Error getting publisher states for pipeline {pipeline_id}: {e}")
                 
-                # Get enhanced publisher states with failure information
-                if hasattr(pipeline_instance, 'get_publisher_states'):
-                    try:
-                        publisher_states = pipeline_instance.get_publisher_states()
-                        # Update destinations with enhanced state information
-                        if 'destinations' in pipeline_copy and publisher_states:
-                            for dest in pipeline_copy['destinations']:
-                                dest_id = dest.get('id')
-                                if dest_id in publisher_states:
-                                    state = publisher_states[dest_id]
-                                    dest['failure_count'] = state.get('failure_count', 0)
-                                    dest['auto_disabled'] = state.get('auto_disabled', False)
-                                    dest['last_error'] = state.get('last_error', None)
-                    except Exception as e:
-                        print(f"Error getting publisher states for pipeline {pipeline_id}: {e}")
+                if current_metrics is not None:
+                    # Update the stats with real-time data
+                    pipeline_copy['stats'] = {
+                        'frame_count': current_metrics.get('frame_count', 0),
+                        'inference_count': current_metrics.get('inference_count', 0),
+                        'fps': round(current_metrics.get('fps', 0), 1),
+                        'latency_ms': round(current_metrics.get('latency_ms', 0), 1),
+                        'elapsed_time': round(current_metrics.get('elapsed_time', 0), 1)
+                    }
+                    # Add uptime to the pipeline data
+                    pipeline_copy['uptime'] = current_metrics.get('uptime', '0s')
+                
+                # Update destinations with enhanced state information
+                if 'destinations' in pipeline_copy and publisher_states:
+                    # Copy each destination before annotating it so the stored metadata is untouched
+                    pipeline_copy['destinations'] = [dest.copy() for dest in pipeline_copy['destinations']]
+                    for dest in pipeline_copy['destinations']:
+                        dest_id = dest.get('id')
+                        if dest_id in publisher_states:
+                            state = publisher_states[dest_id]
+                            dest['failure_count'] = state.get('failure_count', 0)
+                            dest['auto_disabled'] = state.get('auto_disabled', False)
+                            dest['last_error'] = state.get('last_error', None)
             
             pipelines_with_metrics[pipeline_id] = pipeline_copy
-            
+        
+        # Only cache the result if no pipeline changed while it was being built
+        with self._lock:
+            if self._cache_generation == generation:
+                self._list_cache = pipelines_with_metrics
+                self._list_cache_ts = now
         return pipelines_with_metrics
     
     def get_pipeline_summary(self) -> Dict[str, Any]:
         """Get a summary of pipelines for discovery service"""
         all_pipelines = self.list_pipelines()
         
+        # Count, sum and build cards in a single pass over the pipelines
         total_pipelines = len(all_pipelines)
-        active_pipelines = len([p for p in all_pipelines.values() if p.get('status') == 'running'])
-        
-        # Calculate averages
-        total_fps = sum(p.get('stats', {}).get('fps', 0) for p in all_pipelines.values())
-        avg_fps = round(total_fps / max(active_pipelines, 1), 1) if active_pipelines > 0 else 0
-        
-        total_latency = sum(p.get('stats', {}).get('latency_ms', 0) for p in all_pipelines.values())
-        avg_latency = round(total_latency / max(active_pipelines, 1), 1) if active_pipelines > 0 else 0
-        
-        # Get pipeline details for cards
+        active_pipelines = 0
+        total_fps = 0
+        total_latency = 0
         pipeline_cards = []
         for pipeline_id, pipeline_data in all_pipelines.items():
-            card_data = {
+            status = pipeline_data.get('status', 'stopped')
+            stats = pipeline_data.get('stats', {})
+            if status == 'running':
+                active_pipelines += 1
+            total_fps += stats.get('fps', 0)
+            total_latency += stats.get('latency_ms', 0)
+            
+            # Get pipeline details for cards
+            pipeline_cards.append({
                 'id': pipeline_id,
                 'name': pipeline_data.get('name', 'Unnamed Pipeline'),
                 'description': pipeline_data.get('description', ''),
-                'status': pipeline_data.get('status', 'stopped'),
+                'status': status,
                 'model': pipeline_data.get('model', {}),
                 'frame_source': pipeline_data.get('frame_source', {}),
-                'stats': pipeline_data.get('stats', {}),
+                'stats': stats,
                 'created_date': pipeline_data.get('created_date'),
                 'inference_enabled': pipeline_data.get('inference_enabled', True)
-            }
-            pipeline_cards.append(card_data)
+            })
+        
+        # Calculate averages
+        avg_fps = round(total_fps / active_pipelines, 1) if active_pipelines > 0 else 0
+        avg_latency = round(total_latency / active_pipelines, 1) if active_pipelines > 0 else 0
         
         return {
             'total_pipelines': total_pipelines,
@@ -285,8 +580,9 @@ class PipelineManager:
     
     def delete_pipeline(self, pipeline_id: str) -> bool:
         """Delete a pipeline"""
-        if pipeline_id not in self.metadata:
-            return False
+        with self._lock:
+            if pipeline_id not in self.metadata:
+                return False
         
         # Stop pipeline if running
         self.stop_pipeline(pipeline_id)
@@ -295,124 +591,133 @@ class PipelineManager:
         self.delete_pipeline_thumbnail(pipeline_id)
         
         # Remove from metadata
-        del self.metadata[pipeline_id]
-        self._save_metadata()
+        with self._lock:
+            self.metadata.pop(pipeline_id, None)
+            self._dest_index.pop(pipeline_id, None)
+            self._save_metadata()
         
         return True
     
     def update_pipeline(self, pipeline_id: str, config: Dict[str, Any]) -> bool:
         """Update an existing pipeline configuration"""
-        if pipeline_id not in self.metadata:
-            return False
+        with self._lock:
+            if pipeline_id not in self.metadata:
+                return False
         
-        # Don't allow updating running pipelines
-        if pipeline_id in self.active_pipelines:
-            return False
+            # Don't allow updating running pipelines
+            if pipeline_id in self.active_pipelines:
+                return False
+        
+            # Update the pipeline data, preserving existing fields not in config
+            pipeline_data = self.metadata[pipeline_id]
+            now_iso = datetime.now().isoformat()
         
-        # Update the pipeline data, preserving existing fields not in config
-        pipeline_data = self.metadata[pipeline_id]
-        
-        # Update basic info
-        if 'name' in config:
-            pipeline_data['name'] = config['name']
-        if 'description' in config:
-            pipeline_data['description'] = config['description']
-        if 'frame_source' in config:
-            pipeline_data['frame_source'] = config['frame_source']
-        if 'model' in config:
-            pipeline_data['model'] = config['model']
-        if 'destinations' in config:
-            # Process destinations to preserve IDs and enabled states from existing destinations
-            processed_destinations = []
-            existing_destinations = pipeline_data.get('destinations', [])
+            # Update basic info
+            if 'name' in config:
+                pipeline_data['name'] = config['name']
+            if 'description' in config:
+                pipeline_data['description'] = config['description']
+            if 'frame_source' in config:
+                pipeline_data['frame_source'] = config['frame_source']
+            if 'model' in config:
+                pipeline_data['model'] = self._normalize_model_config(config['model'])
+            if 'destinations' in config:
+                # Process destinations to preserve IDs and enabled states from existing destinations
+                processed_destinations = []
+                existing_destinations = pipeline_data.get('destinations', [])
+                existing_by_id = {existing.get('id'): existing for existing in reversed(existing_destinations)}
+                # Normalize each existing config once so the type/config fallback is a dict lookup
+                existing_by_type_config = {}
+                for existing in existing_destinations:
+                    key = (existing.get('type'), self._config_key(existing.get('config')))
+                    existing_by_type_config.setdefault(key, existing)
+                # Destination types that can match at all; configs of other types are never serialized
+                existing_types = {dest_type for dest_type, _ in existing_by_type_config}
             
-            for new_dest in config['destinations']:
-                processed_dest = new_dest.copy()
+                for new_dest in config['destinations']:
+                    processed_dest = new_dest.copy()
                 
-                # First try to find existing destination by ID if provided
-                existing_dest = None
-                if 'id' in new_dest and new_dest['id']:
-                    for existing in existing_destinations:
-                        if existing.get('id') == new_dest['id']:
-                            existing_dest = existing
-                            break
+                    # First try to find existing destination by ID if provided
+                    existing_dest = None
+                    if 'id' in new_dest and new_dest['id']:
+                        existing_dest = existing_by_id.get(new_dest['id'])
                 
-                # If not found by ID, try to match by type and config
-                if not existing_dest:
-                    for existing in existing_destinations:
-                        if (existing.get('type') == new_dest.get('type') and 
-                            existing.get('config') == new_dest.get('config')):
-                            existing_dest = existing
-                            break
+                    # If not found by ID, try to match by type and config
+                    if not existing_dest and new_dest.get('type') in existing_types:
+                        existing_dest = existing_by_type_config.get(
+                            (new_dest.get('type'), self._config_key(new_dest.get('config'))))
                 
-                if existing_dest:
-                    # Preserve existing ID, but allow enabled state to be updated from frontend
-                    processed_dest['id'] = existing_dest.get('id', str(uuid.uuid4()))
-                    # Use the enabled state from the frontend (allow UI changes to persist)
-                    processed_dest['enabled'] = processed_dest.get('enabled', existing_dest.get('enabled', True))
-                else:
-                    # New destination - assign new ID if not provided and default to enabled
-                    if 'id' not in processed_dest or not processed_dest['id']:
-                        processed_dest['id'] = str(uuid.uuid4())
+                    if existing_dest:
+                        # Preserve existing ID, but allow enabled state to be updated from frontend
+                        processed_dest['id'] = existing_dest.get('id', str(uuid.uuid4()))
+                        # Use the enabled state from the frontend (allow UI changes to persist)
+                        processed_dest['enabled'] = processed_dest.get('enabled', existing_dest.get('enabled', True))
                     else:
-                        # Convert frontend ID to proper UUID format
-                        processed_dest['id'] = self._ensure_destination_uuid(processed_dest['id'])
-                    processed_dest['enabled'] = processed_dest.get('enabled', True)
+                        # New destination - assign new ID if not provided and default to enabled
+                        if 'id' not in processed_dest or not processed_dest['id']:
+                            processed_dest['id'] = str(uuid.uuid4())
+                        else:
+                            # Convert frontend ID to proper UUID format
+                            processed_dest['id'] = self._ensure_destination_uuid(processed_dest['id'])
+                        processed_dest['enabled'] = processed_dest.get('enabled', True)
                 
-                processed_destinations.append(processed_dest)
+                    processed_destinations.append(processed_dest)
             
-            pipeline_data['destinations'] = processed_destinations
-        if 'inference_enabled' in config:
-            pipeline_data['inference_enabled'] = config['inference_enabled']
+                pipeline_data['destinations'] = processed_destinations
+            if 'inference_enabled' in config:
+                pipeline_data['inference_enabled'] = config['inference_enabled']
+            if 'cpu_affinity' in config:
+                pipeline_data['cpu_affinity'] = config['cpu_affinity']
         
-        # Update modified date
-        pipeline_data['modified_date'] = datetime.now().isoformat()
+            # Update modified date
+            pipeline_data['modified_date'] = now_iso
         
-        # Save to metadata
-        self.metadata[pipeline_id] = pipeline_data
-        self._save_metadata()
+            # Save to metadata
+            self.metadata[pipeline_id] = pipeline_data
+            self._rebuild_dest_index(pipeline_id)
+            self._save_metadata()
         
-        return True
+            return True
     
     def start_pipeline(self, pipeline_id: str, model_repo, result_publisher) -> bool:
         """Start a pipeline in a background thread"""
-        if pipeline_id not in self.metadata:
-            self.logger.error(f"Cannot start pipeline {pipeline_id} - not found in metadata")
-            return False
+        with self._lock:
+            if pipeline_id not in self.metadata:
+                self.logger.error(f"Cannot start pipeline {pipeline_id} - not found in metadata")
+                return False
         
-        # Check if pipeline is actually running, not just in the dictionary
-        if pipeline_id in self.active_pipelines:
-            active_pipeline = self.active_pipelines[pipeline_id]
-            # Check if the pipeline instance exists and is actually running
-            if 'pipeline_instance' in active_pipeline:
-                pipeline_instance = active_pipeline['pipeline_instance']
-                
-                # Use the pipeline's state tracking to determine if it's actually running
-                if hasattr(pipeline_instance, 'is_running') and pipeline_instance.is_running():
-                    self.logger.warning(f"Cannot start pipeline {pipeline_id} - already running")
-                    return False
+            # Check if pipeline is actually running, not just in the dictionary
+            active_pipeline = self.active_pipelines.get(pipeline_id)
+            if active_pipeline is not None:
+                # Check if the pipeline instance exists and is actually running
+                pipeline_instance = active_pipeline.get('pipeline_instance')
+                if pipeline_instance is not None:
+                    # Use the pipeline's state tracking to determine if it's actually running
+                    if active_pipeline['caps']['is_running'] and pipeline_instance.is_running():
+                        self.logger.warning(f"Cannot start pipeline {pipeline_id} - already running")
+                        return False
+                    else:
+                        self.logger.info(f"Cleaning up stale pipeline {pipeline_id} entry")
+                        # Clean up stale entry
+                        self._cleanup_stale_pipeline_state(pipeline_id)
                 else:
-                    self.logger.info(f"Cleaning up stale pipeline {pipeline_id} entry")
-                    # Clean up stale entry
+                    self.logger.info(f"Cleaning up incomplete pipeline {pipeline_id} entry")
+                    # Clean up incomplete entry
                     self._cleanup_stale_pipeline_state(pipeline_id)
-            else:
-                self.logger.info(f"Cleaning up incomplete pipeline {pipeline_id} entry")
-                # Clean up incomplete entry
-                self._cleanup_stale_pipeline_state(pipeline_id)
         
-        pipeline_config = self.metadata[pipeline_id]
+            pipeline_config = self.metadata[pipeline_id]
         self.logger.info(f"Starting pipeline {pipeline_id} ({pipeline_config.get('name', 'Unknown')})")
         self.logger.debug(f"Pipeline status: {pipeline_config.get('status', 'unknown')}, Active pipelines count: {len(self.active_pipelines)}")
         
         # Check if this is a folder source and log the folder path
         frame_source = pipeline_config.get('frame_source', {})
-        if frame_source.get('capture_type') in ['image_folder', 'folder']:
+        if frame_source.get('capture_type') in _FOLDER_CAPTURE_TYPES:
             folder_path = frame_source.get('config', {}).get('source', 'Unknown')
             self.logger.info(f"Folder source detected - watching folder: {folder_path}")
         
         try:
-            # Create a startup status indicator
-            startup_status = {'started': False, 'error': None}
+            # Create a startup status indicator; the event is set once started or error is filled in
+            startup_status = {'started': False, 'error': None, 'event': threading.Event()}
             
             # Create pipeline thread with startup status callback
             pipeline_thread = threading.Thread(
@@ -422,55 +727,54 @@ class PipelineManager:
             )
             
             # Mark as starting
-            self.metadata[pipeline_id]['status'] = 'starting'
-            self.active_pipelines[pipeline_id] = {
-                'config': pipeline_config,
-                'start_time': time.time(),
-                'frame_count': 0,
-                'inference_count': 0,
-                'startup_status': startup_status
-            }
+            with self._lock:
+                pipeline_config['status'] = 'starting'
+                self.active_pipelines[pipeline_id] = {
+                    'config': pipeline_config,
+                    'start_time': time.time(),
+                    'frame_count': 0,
+                    'inference_count': 0,
+                    'startup_status': startup_status,
+                    # Set when the pipeline's run loop exits or the pipeline is removed
+                    'stop_event': threading.Event()
+                }
             
-            self.logger.debug(f"Starting thread for pipeline {pipeline_id}")
-            # Start thread
-            pipeline_thread.start()
-            self.pipeline_threads[pipeline_id] = pipeline_thread
+                self.logger.debug(f"Starting thread for pipeline {pipeline_id}")
+                # Start thread
+                pipeline_thread.start()
+                self.pipeline_threads[pipeline_id] = pipeline_thread
             
             # Wait for pipeline to actually start or fail (max 10 seconds)
             max_wait_time = 10  # seconds
-            wait_interval = 0.1  # seconds
-            total_waited = 0
+            startup_status['event'].wait(timeout=max_wait_time)
             
-            while total_waited < max_wait_time:
-                if startup_status['started']:
-                    # Pipeline started successfully
-                    self.metadata[pipeline_id]['status'] = 'running'
+            if startup_status['started']:
+                # Pipeline started successfully
+                with self._lock:
+                    pipeline_config['status'] = 'running'
                     self._save_metadata()
-                    print(f"PipelineManager: Pipeline {pipeline_id} started successfully")
-                    return True
-                elif startup_status['error']:
-                    # Pipeline failed to start
-                    print(f"PipelineManager: Pipeline {pipeline_id} failed to start: {startup_status['error']}")
-                    # Clean up
-                    if pipeline_id in self.active_pipelines:
-                        del self.active_pipelines[pipeline_id]
-                    self.metadata[pipeline_id]['status'] = 'error'
+                self.logger.info(f"Pipeline {pipeline_id} started successfully")
+                return True
+            elif startup_status['error']:
+                # Pipeline failed to start
+                self.logger.error(f"Pipeline {pipeline_id} failed to start: {startup_status['error']}")
+                # Clean up
+                with self._lock:
+                    self._remove_active_pipeline(pipeline_id)
+                    pipeline_config['status'] = 'error'
                     self._save_metadata()
-                    return False
-                
-                time.sleep(wait_interval)
-                total_waited += wait_interval
+                return False
             
             # Timeout - pipeline didn't start in time
-            print(f"PipelineManager: Timeout waiting for pipeline {pipeline_id} to start")
-            if pipeline_id in self.active_pipelines:
-                del self.active_pipelines[pipeline_id]
-            self.metadata[pipeline_id]['status'] = 'error'
-            self._save_metadata()
+            self.logger.error(f"Timeout waiting for pipeline {pipeline_id} to start")
+            with self._lock:
+                self._remove_active_pipeline(pipeline_id)
+                pipeline_config['status'] = 'error'
+                self._save_metadata()
             return False
             
         except Exception as e:
-            print(f"PipelineManager: Error starting pipeline {pipeline_id}: {e}")
+            self.logger.error(f"Error starting pipeline {pipeline_id}: {e}")
             return False
     
     def stop_pipeline(self, pipeline_id: str) -> bool:
@@ -479,43 +783,51 @@ class PipelineManager:
             # return False
         
         try:
-            # Stop the pipeline instance if it exists
-            if pipeline_id in self.active_pipelines and 'pipeline_instance' in self.active_pipelines[pipeline_id]:
-                pipeline_instance = self.active_pipelines[pipeline_id]['pipeline_instance']
-                if hasattr(pipeline_instance, 'stop'):
+            # Stop the pipeline instance if it exists (outside the lock - stop() joins the run thread)
+            with self._lock:
+                active_pipeline = self.active_pipelines.get(pipeline_id)
+                if active_pipeline is not None:
+                    # Tell the supervisor thread this stop was requested, not a pipeline failure
+                    active_pipeline['stopping'] = True
+            if active_pipeline and 'pipeline_instance' in active_pipeline:
+                pipeline_instance = active_pipeline['pipeline_instance']
+                if active_pipeline['caps']['stop']:
                     pipeline_instance.stop()
+                # Stopping saves a final thumbnail
+                self._invalidate_thumbnail_cache(pipeline_id)
             
-            # Mark as stopped
-            if pipeline_id in self.metadata:
-                self.metadata[pipeline_id]['status'] = 'stopped'
-            
-            # Remove from active pipelines
-            if pipeline_id in self.active_pipelines:
-                del self.active_pipelines[pipeline_id]
+            with self._lock:
+                # Mark as stopped
+                meta = self.metadata.get(pipeline_id)
+                if meta is not None:
+                    meta['status'] = 'stopped'
             
-            # Note: Thread will stop on next iteration when it checks active_pipelines
-            if pipeline_id in self.pipeline_threads:
-                del self.pipeline_threads[pipeline_id]
+                # Remove from active pipelines - this wakes the supervisor thread, which then exits
+                self._remove_active_pipeline(pipeline_id)
+                self.pipeline_threads.pop(pipeline_id, None)
             
-            self._save_metadata()
+                self._save_metadata()
             return True
             
         except Exception as e:
-            print(f"Error stopping pipeline {pipeline_id}: {e}")
+            self.logger.error(f"Error stopping pipeline {pipeline_id}: {e}")
             return False
     
     def enable_pipeline_inference(self, pipeline_id: str) -> bool:
         """Enable inference for a pipeline"""
         try:
             # Update metadata
-            if pipeline_id in self.metadata:
-                self.metadata[pipeline_id]['inference_enabled'] = True
-                self._save_metadata()
+            with self._lock:
+                meta = self.metadata.get(pipeline_id)
+                if meta is not None and meta.get('inference_enabled') is not True:
+                    meta['inference_enabled'] = True
+                    self._save_metadata()
             
             # Update running pipeline instance
-            if pipeline_id in self.active_pipelines and 'pipeline_instance' in self.active_pipelines[pipeline_id]:
-                pipeline_instance = self.active_pipelines[pipeline_id]['pipeline_instance']
-                if hasattr(pipeline_instance, 'enable_inference'):
+            active_pipeline = self.active_pipelines.get(pipeline_id)
+            pipeline_instance = active_pipeline.get('pipeline_instance') if active_pipeline else None
+            if pipeline_instance is not None:
+                if active_pipeline['caps']['enable_inference']:
                     pipeline_instance.enable_inference()
             
             return True
@@ -527,14 +839,17 @@ class PipelineManager:
         """Disable inference for a pipeline"""
         try:
             # Update metadata
-            if pipeline_id in self.metadata:
-                self.metadata[pipeline_id]['inference_enabled'] = False
-                self._save_metadata()
+            with self._lock:
+                meta = self.metadata.get(pipeline_id)
+                if meta is not None and meta.get('inference_enabled') is not False:
+                    meta['inference_enabled'] = False
+                    self._save_metadata()
             
             # Update running pipeline instance
-            if pipeline_id in self.active_pipelines and 'pipeline_instance' in self.active_pipelines[pipeline_id]:
-                pipeline_instance = self.active_pipelines[pipeline_id]['pipeline_instance']
-                if hasattr(pipeline_instance, 'disable_inference'):
+            active_pipeline = self.active_pipelines.get(pipeline_id)
+            pipeline_instance = active_pipeline.get('pipeline_instance') if active_pipeline else None
+            if pipeline_instance is not None:
+                if active_pipeline['caps']['disable_inference']:
                     pipeline_instance.disable_inference()
             
             return True
@@ -545,34 +860,33 @@ class PipelineManager:
     def enable_pipeline_publisher(self, pipeline_id: str, publisher_id: str) -> bool:
         """Enable a specific publisher for a pipeline"""
         try:
-            print(f"DEBUG: enable_pipeline_publisher called with pipeline_id='{pipeline_id}', publisher_id='{publisher_id}'")
+            self.logger.debug("enable_pipeline_publisher pipeline_id=%s publisher_id=%s", pipeline_id, publisher_id)
             
             # Update metadata
-            if pipeline_id in self.metadata:
-                destinations = self.metadata[pipeline_id].get('destinations', [])
-                for dest in destinations:
-                    if str(dest.get('id')) == str(publisher_id):
+            with self._lock:
+                if pipeline_id in self.metadata:
+                    dest = self._dest_index.get(pipeline_id, {}).get(str(publisher_id))
+                    if dest is not None:
                         dest['enabled'] = True
-                        print(f"DEBUG: Updated metadata for destination {publisher_id} to enabled=True")
-                        break
+                        self.logger.debug("Updated metadata for destination %s to enabled=True", publisher_id)
+                    else:
+                        self.logger.debug("Publisher %s not found in metadata destinations", publisher_id)
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug("Available destination IDs: %s", list(self._dest_index.get(pipeline_id, {})))
+                    self._save_metadata()
                 else:
-                    print(f"DEBUG: Publisher {publisher_id} not found in metadata destinations")
-                    # Print all destination IDs for debugging
-                    print(f"DEBUG: Available destination IDs: {[str(dest.get('id')) for dest in destinations]}")
-                self._save_metadata()
-            else:
-                print(f"DEBUG: Pipeline {pipeline_id} not found in metadata")
+                    self.logger.debug("Pipeline %s not found in metadata", pipeline_id)
             
             # Update running pipeline instance
-            if pipeline_id in self.active_pipelines and 'pipeline_instance' in self.active_pipelines[pipeline_id]:
-                pipeline_instance = self.active_pipelines[pipeline_id]['pipeline_instance']
-                if hasattr(pipeline_instance, 'enable_publisher'):
-                    print(f"DEBUG: Calling enable_publisher on pipeline instance")
+            active_pipeline = self.active_pipelines.get(pipeline_id)
+            pipeline_instance = active_pipeline.get('pipeline_instance') if active_pipeline else None
+            if pipeline_instance is not None:
+                if active_pipeline['caps']['enable_publisher']:
                     pipeline_instance.enable_publisher(publisher_id)
                 else:
-                    print(f"DEBUG: Pipeline instance does not have enable_publisher method")
+                    self.logger.debug("Pipeline instance does not have enable_publisher method")
             else:
-                print(f"DEBUG: Pipeline {pipeline_id} not found in active_pipelines or no pipeline_instance")
+                self.logger.debug("Pipeline %s not found in active_pipelines or no pipeline_instance", pipeline_id)
             
             return True
         except Exception as e:
@@ -582,34 +896,33 @@ class PipelineManager:
     def disable_pipeline_publisher(self, pipeline_id: str, publisher_id: str) -> bool:
         """Disable a specific publisher for a pipeline"""
         try:
-            print(f"DEBUG: disable_pipeline_publisher called with pipeline_id='{pipeline_id}', publisher_id='{publisher_id}'")
+            self.logger.debug("disable_pipeline_publisher pipeline_id=%s publisher_id=%s", pipeline_id, publisher_id)
             
             # Update metadata
-            if pipeline_id in self.metadata:
-                destinations = self.metadata[pipeline_id].get('destinations', [])
-                for dest in destinations:
-                    if str(dest.get('id')) == str(publisher_id):
+            with self._lock:
+                if pipeline_id in self.metadata:
+                    dest = self._dest_index.get(pipeline_id, {}).get(str(publisher_id))
+                    if dest is not None:
                         dest['enabled'] = False
-                        print(f"DEBUG: Updated metadata for destination {publisher_id} to enabled=False")
-                        break
+                        self.logger.debug("Updated metadata for destination %s to enabled=False", publisher_id)
+                    else:
+                        self.logger.debug("Publisher %s not found in metadata destinations", publisher_id)
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug("Available destination IDs: %s", list(self._dest_index.get(pipeline_id, {})))
+                    self._save_metadata()
                 else:
-                    print(f"DEBUG: Publisher {publisher_id} not found in metadata destinations")
-                    # Print all destination IDs for debugging
-                    print(f"DEBUG: Available destination IDs: {[str(dest.get('id')) for dest in destinations]}")
-                self._save_metadata()
-            else:
-                print(f"DEBUG: Pipeline {pipeline_id} not found in metadata")
+                    self.logger.debug("Pipeline %s not found in metadata", pipeline_id)
             
             # Update running pipeline instance
-            if pipeline_id in self.active_pipelines and 'pipeline_instance' in self.active_pipelines[pipeline_id]:
-                pipeline_instance = self.active_pipelines[pipeline_id]['pipeline_instance']
-                if hasattr(pipeline_instance, 'disable_publisher'):
-                    print(f"DEBUG: Calling disable_publisher on pipeline instance")
+            active_pipeline = self.active_pipelines.get(pipeline_id)
+            pipeline_instance = active_pipeline.get('pipeline_instance') if active_pipeline else None
+            if pipeline_instance is not None:
+                if active_pipeline['caps']['disable_publisher']:
                     pipeline_instance.disable_publisher(publisher_id)
                 else:
-                    print(f"DEBUG: Pipeline instance does not have disable_publisher method")
+                    self.logger.debug("Pipeline instance does not have disable_publisher method")
             else:
-                print(f"DEBUG: Pipeline {pipeline_id} not found in active_pipelines or no pipeline_instance")
+                self.logger.debug("Pipeline %s not found in active_pipelines or no pipeline_instance", pipeline_id)
             
             return True
         except Exception as e:
@@ -619,92 +932,97 @@ class PipelineManager:
     def get_pipeline_publisher_states(self, pipeline_id: str) -> Dict[str, Any]:
         """Get the current state of all publishers for a pipeline"""
         try:
-            if pipeline_id not in self.metadata:
-                return {}
-            
-            # Get states from metadata
-            metadata_states = {}
-            destinations = self.metadata[pipeline_id].get('destinations', [])
-            for dest in destinations:
-                dest_id = dest.get('id')
-                if dest_id:
-                    metadata_states[dest_id] = {
+            with self._lock:
+                meta = self.metadata.get(pipeline_id)
+                if meta is None:
+                    return {}
+                
+                # Get states from metadata, string-keyed so the result is JSON-serializable as-is
+                metadata_states = {
+                    str(dest['id']): {
                         'enabled': dest.get('enabled', True),
                         'type': dest.get('type', 'unknown'),
                         'configured': True
                     }
+                    for dest in meta.get('destinations', []) if dest.get('id')
+                }
+                active_pipeline = self.active_pipelines.get(pipeline_id)
             
-            # Get real-time states from running pipeline if available
-            if pipeline_id in self.active_pipelines and 'pipeline_instance' in self.active_pipelines[pipeline_id]:
-                pipeline_instance = self.active_pipelines[pipeline_id]['pipeline_instance']
-                if hasattr(pipeline_instance, 'get_publisher_states'):
-                    try:
-                        runtime_states = pipeline_instance.get_publisher_states()
-                        # Merge runtime states with metadata states
-                        for publisher_id, runtime_state in runtime_states.items():
-                            # Ensure publisher_id is a string for JSON serialization
-                            str_publisher_id = str(publisher_id)
-                            if str_publisher_id in metadata_states:
-                                metadata_states[str_publisher_id].update(runtime_state)
-                    except Exception:
-                        pass  # Silently continue if runtime states fail
+            # Idle pipelines have no runtime state to merge
+            pipeline_instance = active_pipeline.get('pipeline_instance') if active_pipeline else None
+            if pipeline_instance is None or not active_pipeline['caps']['get_publisher_states']:
+                return metadata_states
             
-            # Ensure all keys in the final dictionary are strings for JSON serialization
-            string_keyed_states = {}
-            for key, value in metadata_states.items():
-                string_keyed_states[str(key)] = value
+            # Merge real-time states from the running pipeline
+            try:
+                runtime_states = pipeline_instance.get_publisher_states()
+                for publisher_id, runtime_state in runtime_states.items():
+                    state = metadata_states.get(str(publisher_id))
+                    if state is not None:
+                        state.update(runtime_state)
+            except Exception:
+                pass  # Silently continue if runtime states fail
             
-            return string_keyed_states
-        except Exception as e:
-            print(f"Error in get_pipeline_publisher_states for pipeline {pipeline_id}: {e}")
-            print(f"Exception type: {type(e)}")
-            import traceback
-            traceback.print_exc()
+            return metadata_states
+        except Exception:
+            self.logger.exception("Error in get_pipeline_publisher_states for pipeline %s", pipeline_id)
             return {}
     
+    def _thumbnail_file(self, pipeline_id: str) -> str:
+        """Get the on-disk location of a pipeline's thumbnail (whether or not it exists)"""
+        return os.path.join(self.thumbnails_dir, f"thumbnail_{pipeline_id}.jpg")
+    
+    def _invalidate_thumbnail_cache(self, pipeline_id: str):
+        """Forget the cached thumbnail presence for a pipeline"""
+        self._thumbnail_cache.pop(pipeline_id, None)
+    
     def get_pipeline_thumbnail_path(self, pipeline_id: str) -> Optional[str]:
         """Get the thumbnail path for a pipeline"""
-        thumbnail_path = os.path.join(self.thumbnails_dir, f"thumbnail_{pipeline_id}.jpg")
-        file_exists = os.path.exists(thumbnail_path)
-        print(f"PipelineManager: get_pipeline_thumbnail_path({pipeline_id}) -> {thumbnail_path}, exists: {file_exists}")
-        if file_exists:
-            return thumbnail_path
-        return None
+        now = time.monotonic()
+        cached = self._thumbnail_cache.get(pipeline_id)
+        if cached is not None and now - cached[0] < self._thumbnail_cache_ttl:
+            return cached[1]
+        
+        thumbnail_path = self._thumbnail_file(pipeline_id)
+        if not os.path.exists(thumbnail_path):
+            thumbnail_path = None
+        self._thumbnail_cache[pipeline_id] = (now, thumbnail_path)
+        self.logger.debug("get_pipeline_thumbnail_path(%s) -> %s", pipeline_id, thumbnail_path)
+        return thumbnail_path
     
     def has_pipeline_thumbnail(self, pipeline_id: str) -> bool:
         """Check if a pipeline has a thumbnail"""
-        result = self.get_pipeline_thumbnail_path(pipeline_id) is not None
-        print(f"PipelineManager: has_pipeline_thumbnail({pipeline_id}) -> {result}")
-        return result
+        return self.get_pipeline_thumbnail_path(pipeline_id) is not None
     
     def delete_pipeline_thumbnail(self, pipeline_id: str):
         """Delete a pipeline's thumbnail file"""
-        thumbnail_path = os.path.join(self.thumbnails_dir, f"thumbnail_{pipeline_id}.jpg")
-        if os.path.exists(thumbnail_path):
-            try:
-                os.remove(thumbnail_path)
-                print(f"Deleted thumbnail for pipeline {pipeline_id}")
-            except Exception as e:
-                print(f"Failed to delete thumbnail for pipeline {pipeline_id}: {e}")
+        self._invalidate_thumbnail_cache(pipeline_id)
+        try:
+            os.remove(self._thumbnail_file(pipeline_id))
+            print(f"Deleted thumbnail for pipeline {pipeline_id}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Failed to delete thumbnail for pipeline {pipeline_id}: {e}")
 
     def generate_pipeline_thumbnail(self, pipeline_id: str) -> bool:
         """Generate a fresh thumbnail for a pipeline from its current frame"""
         try:
             # Check if pipeline exists and is running
-            if pipeline_id not in self.active_pipelines:
+            active_pipeline = self.active_pipelines.get(pipeline_id)
+            if active_pipeline is None:
                 print(f"Pipeline {pipeline_id} is not active, cannot generate thumbnail")
                 return False
             
             # Get the pipeline instance
-            active_pipeline = self.active_pipelines[pipeline_id]
-            if 'pipeline_instance' not in active_pipeline:
+            pipeline_instance = active_pipeline.get('pipeline_instance')
+            if pipeline_instance is None:
                 print(f"Pipeline {pipeline_id} has no instance, cannot generate thumbnail")
                 return False
             
-            pipeline_instance = active_pipeline['pipeline_instance']
-            
             # Get the latest frame from the pipeline
-            if not hasattr(pipeline_instance, 'get_latest_frame'):
+            caps = active_pipeline['caps']
+            if not caps['get_latest_frame']:
                 print(f"Pipeline {pipeline_id} does not support frame access")
                 return False
             
@@ -714,18 +1032,16 @@ class PipelineManager:
                 return False
             
             # Set thumbnail path if not already set
-            if not hasattr(pipeline_instance, 'set_thumbnail_path') or not hasattr(pipeline_instance, 'capture_thumbnail'):
+            if not caps['set_thumbnail_path'] or not caps['capture_thumbnail']:
                 print(f"Pipeline {pipeline_id} does not support thumbnail capture")
                 return False
             
-            # Ensure thumbnails directory exists
-            os.makedirs(self.thumbnails_dir, exist_ok=True)
-            
-            # Set the thumbnail path on the pipeline instance
+            # Set the thumbnail path on the pipeline instance (thumbnails_dir is created in __init__)
             pipeline_instance.set_thumbnail_path(self.thumbnails_dir)
             
             # Capture the thumbnail from the current frame
             success = pipeline_instance.capture_thumbnail(current_frame)
+            self._invalidate_thumbnail_cache(pipeline_id)
             
             if success:
                 print(f"Successfully generated thumbnail for pipeline {pipeline_id}")
@@ -762,15 +1078,8 @@ class PipelineManager:
         frame_source_type = frame_source_config.get('capture_type', 'webcam')  # UI sends 'type', not 'capture_type'
         frame_source_settings = frame_source_config.get('config', {})
         
-        # Map UI capture types to FrameSourceFactory types
-        capture_type_mapping = {
-            'ip_camera': 'ipcam',  # UI uses 'ip_camera', FrameSourceFactory expects 'ipcam'
-            'image_folder': 'folder',  # UI uses 'image_folder', FrameSourceFactory expects 'folder'
-            # Add other mappings as needed
-        }
-        
-        # Apply mapping if needed
-        mapped_capture_type = capture_type_mapping.get(frame_source_type, frame_source_type)
+        # Map UI capture types to FrameSourceFactory types if needed
+        mapped_capture_type = _CAPTURE_TYPE_MAPPING.get(frame_source_type, frame_source_type)
         
         # Create the frame source configuration that FrameSourceFactory expects
         final_frame_config = {
@@ -796,7 +1105,7 @@ class PipelineManager:
                     except Exception as e:
                         print(f"Pipeline {pipeline_id}: Warning - could not create folder {source_folder}: {e}")
         
-        print(f"Pipeline {pipeline_id}: Final frame source config: {final_frame_config}")
+        self.logger.debug("Pipeline %s: final frame source config: %s", pipeline_id, final_frame_config)
         
         # Configure inference engine
         model_config = config['model']
@@ -814,211 +1123,58 @@ class PipelineManager:
         device = model_config.get('device', 'cpu')  # Default to cpu if not specified
 
         # Validate device availability based on engine type
-        if engine in ['geti']:
+        if engine in _OPENVINO_ENGINES:
             # For OpenVINO-based engines (GETI), validate OpenVINO devices
-            if device.lower() in ['gpu', 'intel:gpu']:
+            device_lower = device.lower()
+            if device_lower in _OPENVINO_GPU_DEVICES:
                 # Convert to OpenVINO format and validate
                 device = 'GPU'  # OpenVINO expects uppercase
                 try:
-                    from openvino.runtime import Core
-                    core = Core()
-                    available_devices = core.available_devices
-                    if not any('GPU' in dev for dev in available_devices):
-                        print(f"WARNING: Intel GPU requested but not available in OpenVINO. Available devices: {available_devices}. Falling back to CPU.")
+                    available_devices = _openvino_devices()
+                    if available_devices is None:
+                        print(f"WARNING: OpenVINO not available to validate GPU device. Falling back to CPU.")
+                        device = 'CPU'
+                    elif not any('GPU' in dev for dev in available_devices):
+                        print(f"WARNING: Intel GPU requested but not available in OpenVINO. Available devices: {list(available_devices)}. Falling back to CPU.")
                         device = 'CPU'
-                except ImportError:
-                    print(f"WARNING: OpenVINO not available to validate GPU device. Falling back to CPU.")
-                    device = 'CPU'
                 except Exception as e:
                     print(f"WARNING: Error checking OpenVINO devices: {e}. Falling back to CPU.")
                     device = 'CPU'
-            elif device.lower() in ['cpu', 'intel:cpu']:
+            elif device_lower in _OPENVINO_CPU_DEVICES:
                 device = 'CPU'  # OpenVINO expects uppercase
         else:
             # For PyTorch-based engines (ultralytics, torch), validate CUDA devices
-            if device in ['cuda', '0', 'gpu', 'nvidia:gpu'] or (isinstance(device, str) and device.isdigit()):
-                try:
-                    import torch
-                    if not torch.cuda.is_available():
-                        print(f"WARNING: CUDA device '{device}' requested but CUDA is not available. Falling back to CPU.")
-                        device = 'cpu'
-                except ImportError:
+            if device in _CUDA_DEVICES or (isinstance(device, str) and device.isdigit()):
+                cuda_available = _cuda_available()
+                if cuda_available is None:
                     print(f"WARNING: PyTorch not available to check CUDA. Falling back to CPU for device '{device}'.")
                     device = 'cpu'
+                elif not cuda_available:
+                    print(f"WARNING: CUDA device '{device}' requested but CUDA is not available. Falling back to CPU.")
+                    device = 'cpu'
 
         if engine == 'pass':
             # Pass engine doesn't need model_path
             inference_config = {'engine_type': engine, 'device': device}
         else:
-            inference_config = {'engine_type': engine, 'model_path': model_path, 'device': device, 'task': 'detect'}
+            inference_config = {'engine_type': engine, 'model_path': model_path, 'device': device, 'task': 'detect',
+                                'precision': model_config.get('precision', 'fp32')}
 
         # Configure result publisher with destinations
         pipeline_publisher = ResultPublisher()
+        # Node context for variable substitution, shared by every destination of this pipeline
+        context_vars = {'node_id': self.node_id, 'node_name': self.node_name}
         for dest_config in config['destinations']:
-            # Store the destination ID for later reference
-            dest_id = dest_config.get('id')
-            dest_enabled = dest_config.get('enabled', True)
-            
-            # Create destination based on type
-            if dest_config['type'] == 'mqtt':
-                from ResultPublisher.result_destinations import MQTTDestination
-                dest = MQTTDestination()
-                # Set context variables for variable substitution
-                # Note: We need to get these from the InferenceNode instance
-                # For now, we'll need to pass them to the pipeline manager
-                if hasattr(self, 'node_id') and hasattr(self, 'node_name'):
-                    dest.set_context_variables(
-                        node_id=self.node_id,
-                        node_name=self.node_name
-                    )
-                
-                # Configure destination with error handling
-                try:
-                    dest.configure(**dest_config['config'])
-                    # Set the destination ID and enabled state
-                    if dest_id:
-                        dest._id = dest_id
-                    dest.enabled = dest_enabled
-                    pipeline_publisher.add(dest)
-                    print(f"Successfully configured MQTT destination: {dest_config['config'].get('server', 'unknown')}")
-                except Exception as e:
-                    print(f"Failed to configure MQTT destination: {str(e)} - Pipeline will continue without this destination")
-            elif dest_config['type'] == 'webhook':
-                from ResultPublisher.result_destinations import WebhookDestination
-                dest = WebhookDestination()
-                # Set context variables for variable substitution
-                if hasattr(self, 'node_id') and hasattr(self, 'node_name'):
-                    dest.set_context_variables(
-                        node_id=self.node_id,
-                        node_name=self.node_name
-                    )
-                
-                # Configure destination with error handling
-                try:
-                    dest.configure(**dest_config['config'])
-                    # Set the destination ID and enabled state
-                    if dest_id:
-                        dest._id = dest_id
-                    dest.enabled = dest_enabled
-                    pipeline_publisher.add(dest)
-                    print(f"Successfully configured Webhook destination: {dest_config['config'].get('url', 'unknown')}")
-                except Exception as e:
-                    print(f"Failed to configure Webhook destination: {str(e)} - Pipeline will continue without this destination")
-            elif dest_config['type'] == 'null':
-                from ResultPublisher.result_destinations import NullDestination
-                dest = NullDestination()
-                # Set context variables for variable substitution
-                if hasattr(self, 'node_id') and hasattr(self, 'node_name'):
-                    dest.set_context_variables(
-                        node_id=self.node_id,
-                        node_name=self.node_name
-                    )
-                
-                # Configure destination with error handling
-                try:
-                    dest.configure(**dest_config.get('config', {}))
-                    # Set the destination ID and enabled state
-                    if dest_id:
-                        dest._id = dest_id
-                    dest.enabled = dest_enabled
-                    pipeline_publisher.add(dest)
-                    print(f"Successfully configured Null destination")
-                except Exception as e:
-                    print(f"Failed to configure Null destination: {str(e)} - Pipeline will continue without this destination")
-            elif dest_config['type'] == 'serial':
-                from ResultPublisher.result_destinations import SerialDestination
-                dest = SerialDestination()
-                # Set context variables for variable substitution
-                if hasattr(self, 'node_id') and hasattr(self, 'node_name'):
-                    dest.set_context_variables(
-                        node_id=self.node_id,
-                        node_name=self.node_name
-                    )
-                
-                # Configure destination with error handling
-                try:
-                    dest.configure(**dest_config['config'])
-                    # Set the destination ID and enabled state
-                    if dest_id:
-                        dest._id = dest_id
-                    dest.enabled = dest_enabled
-                    pipeline_publisher.add(dest)
-                    print(f"Successfully configured Serial destination: {dest_config['config'].get('com_port', 'unknown')}")
-                except Exception as e:
-                    print(f"Failed to configure Serial destination: {str(e)} - Pipeline will continue without this destination")
-            elif dest_config['type'] == 'folder':
-                from ResultPublisher.result_destinations import FolderDestination
-                dest = FolderDestination()
-                # Set context variables for variable substitution
-                if hasattr(self, 'node_id') and hasattr(self, 'node_name'):
-                    dest.set_context_variables(
-                        node_id=self.node_id,
-                        node_name=self.node_name
-                    )
-                
-                # Configure destination with error handling
-                try:
-                    dest.configure(**dest_config['config'])
-                    # Set the destination ID and enabled state
-                    if dest_id:
-                        dest._id = dest_id
-                    dest.enabled = dest_enabled
-                    pipeline_publisher.add(dest)
-                    print(f"Successfully configured File destination: {dest_config['config'].get('folder_path', 'unknown')}")
-                except Exception as e:
-                    print(f"Failed to configure File destination: {str(e)} - Pipeline will continue without this destination")
-            elif dest_config['type'] == 'roboflow':
-                from ResultPublisher.result_destinations import RoboflowDestination
-                dest = RoboflowDestination()
-                # Set context variables for variable substitution
-                if hasattr(self, 'node_id') and hasattr(self, 'node_name'):
-                    dest.set_context_variables(
-                        node_id=self.node_id,
-                        node_name=self.node_name
-                    )
-                
-                # Configure destination with error handling
-                try:
-                    dest.configure(**dest_config['config'])
-                    # Set the destination ID and enabled state
-                    if dest_id:
-                        dest._id = dest_id
-                    dest.enabled = dest_enabled
-                    pipeline_publisher.add(dest)
-                    print(f"Successfully configured Roboflow destination: {dest_config['config'].get('workspace_id', 'unknown')}/{dest_config['config'].get('project_id', 'unknown')}")
-                except Exception as e:
-                    print(f"Failed to configure Roboflow destination: {str(e)} - Pipeline will continue without this destination")
-            elif dest_config['type'] == 'geti':
-                from ResultPublisher.result_destinations import GetiDestination
-                dest = GetiDestination()
-                # Set context variables for variable substitution
-                if hasattr(self, 'node_id') and hasattr(self, 'node_name'):
-                    dest.set_context_variables(
-                        node_id=self.node_id,
-                        node_name=self.node_name
-                    )
-                
-                # Configure destination with error handling
-                try:
-                    dest.configure(**dest_config['config'])
-                    # Set the destination ID and enabled state
-                    if dest_id:
-                        dest._id = dest_id
-                    dest.enabled = dest_enabled
-                    pipeline_publisher.add(dest)
-                    project_identifier = dest_config['config'].get('project_name') or dest_config['config'].get('project_id', 'unknown')
-                    print(f"Successfully configured Geti destination: {dest_config['config'].get('host', 'unknown')} -> {project_identifier}")
-                except Exception as e:
-                    print(f"Failed to configure Geti destination: {str(e)} - Pipeline will continue without this destination")
-            else:
-                print(f"Unknown destination type: {dest_config['type']} - Skipping this destination")
-            # Add more destination types as needed
+            dest = self._build_destination(dest_config, context_vars)
+            if dest is not None:
+                pipeline_publisher.add(dest)
         
         # Configure the pipeline
         pipeline.configure(
             frame_source_config=final_frame_config,
             inference_engine_config=inference_config,
-            result_publisher=pipeline_publisher
+            result_publisher=pipeline_publisher,
+            cpu_affinity=self._parse_cpu_affinity(pipeline_id, config.get('cpu_affinity'))
         )
         
         # Set up thumbnail path for the pipeline
@@ -1033,6 +1189,45 @@ class PipelineManager:
         
         return pipeline
 
+    def _build_destination(self, dest_config: Dict[str, Any],
+                           context_vars: Optional[Dict[str, Any]] = None) -> Optional[BaseResultDestination]:
+        """Create and configure a result destination from its pipeline config entry
+        
+        Args:
+            dest_config: The destination entry from the pipeline configuration
+            context_vars: Context variables (node_id, node_name, ...) for variable substitution
+        
+        Returns:
+            The configured destination, or None if the type is unknown or configuration failed
+        """
+        dest_type = dest_config['type']
+        registry_entry = _DEST_REGISTRY.get(dest_type)
+        if registry_entry is None:
+            print(f"Unknown destination type: {dest_type} - Skipping this destination")
+            return None
+        dest_class_name, dest_label, describe = registry_entry
+        dest_settings = dest_config.get('config', {})
+        
+        dest = _destination_class(dest_class_name)()
+        # Set context variables for variable substitution
+        if context_vars:
+            dest.set_context_variables(**context_vars)
+        
+        # Configure destination with error handling
+        try:
+            dest.configure(**dest_settings)
+        except Exception as e:
+            print(f"Failed to configure {dest_label} destination: {str(e)} - Pipeline will continue without this destination")
+            return None
+        
+        # Set the destination ID (stored for later reference) and enabled state
+        dest_id = dest_config.get('id')
+        if dest_id:
+            dest._id = dest_id
+        dest.enabled = dest_config.get('enabled', True)
+        print(f"Successfully configured {dest_label} destination: {describe(dest_settings)}")
+        return dest
+
     def _run_pipeline(self, pipeline_id: str, config: Dict[str, Any], model_repo, result_publisher, startup_status=None):
         """Run a pipeline in a background thread
         
@@ -1048,7 +1243,14 @@ class PipelineManager:
             pipeline = self._initialize_pipeline(pipeline_id, config, model_repo)
             
             # Store the pipeline instance so we can stop it
-            self.active_pipelines[pipeline_id]['pipeline_instance'] = pipeline
+            with self._lock:
+                active_pipeline = self.active_pipelines[pipeline_id]
+                active_pipeline['pipeline_instance'] = pipeline
+                active_pipeline['caps'] = _pipeline_capabilities(type(pipeline))
+                stop_event = active_pipeline['stop_event']
+            
+            # Wake up as soon as the run loop exits instead of polling is_running()
+            pipeline.on_stopped(stop_event.set)
             
             print(f"Starting pipeline {pipeline_id}: {config['name']}")
             
@@ -1058,26 +1260,33 @@ class PipelineManager:
             # Signal successful startup
             if startup_status:
                 startup_status['started'] = True
+                startup_status['event'].set()
             
             # Keep track of the pipeline until it's stopped
-            while pipeline_id in self.active_pipelines:
-                time.sleep(1)
-                # Check if pipeline is still running using the pipeline's state
-                if hasattr(pipeline, 'is_running') and not pipeline.is_running():
+            stop_event.wait()
+            ended_on_its_own = False
+            with self._lock:
+                active_pipeline = self.active_pipelines.get(pipeline_id)
+                # Only handle pipelines that ended on their own; stop_pipeline() cleans up after itself
+                if active_pipeline is not None and active_pipeline.get('stop_event') is stop_event \
+                        and not active_pipeline.get('stopping'):
+                    ended_on_its_own = True
                     print(f"Pipeline {pipeline_id} is no longer running")
                     # Check if this was due to an error
-                    if pipeline_id in self.active_pipelines:
-                        if hasattr(pipeline, 'has_error') and pipeline.has_error():
-                            print(f"Pipeline {pipeline_id} stopped with error: {pipeline.get_error()}")
-                            if pipeline_id in self.metadata:
-                                self.metadata[pipeline_id]['status'] = 'error'
-                                # Also disable inference when pipeline errors
-                                self.metadata[pipeline_id]['inference_enabled'] = False
-                        else:
-                            print(f"Pipeline {pipeline_id} stopped normally")
-                        # Clean up both active pipelines and threads
-                        self._cleanup_stale_pipeline_state(pipeline_id)
-                    break
+                    if pipeline.has_error():
+                        print(f"Pipeline {pipeline_id} stopped with error: {pipeline.get_error()}")
+                        meta = self.metadata.get(pipeline_id)
+                        if meta is not None:
+                            meta['status'] = 'error'
+                            # Also disable inference when pipeline errors
+                            meta['inference_enabled'] = False
+                    else:
+                        print(f"Pipeline {pipeline_id} stopped normally")
+                    # Clean up both active pipelines and threads
+                    self._cleanup_stale_pipeline_state(pipeline_id)
+            if ended_on_its_own:
+                # Persist the final state right away rather than waiting for the debounced writer
+                self.flush_metadata()
             
             print(f"Pipeline {pipeline_id} stopped")
             
@@ -1087,18 +1296,30 @@ class PipelineManager:
             # Signal startup failure
             if startup_status:
                 startup_status['error'] = str(e)
+                startup_status['event'].set()
             
             # Mark as error and disable inference on error  
-            self._cleanup_stale_pipeline_state(pipeline_id)
-            if pipeline_id in self.metadata:
-                self.metadata[pipeline_id]['status'] = 'error'
-                self.metadata[pipeline_id]['inference_enabled'] = False
-                self._save_metadata()
+            with self._lock:
+                self._cleanup_stale_pipeline_state(pipeline_id)
+                meta = self.metadata.get(pipeline_id)
+                if meta is not None:
+                    meta['status'] = 'error'
+                    meta['inference_enabled'] = False
+                    self._save_metadata()
+            self.flush_metadata()
     
     def get_pipeline_stats(self) -> Dict[str, Any]:
         """Get overall pipeline statistics with real-time metrics"""
-        total_pipelines = len(self.metadata)
-        active_pipelines = len(self.active_pipelines)
+        now = time.monotonic()
+        cached = self._stats_cache
+        if cached is not None and now - self._stats_cache_ts < self._stats_cache_ttl:
+            return cached
+        
+        with self._lock:
+            generation = self._cache_generation
+            total_pipelines = len(self.metadata)
+            active_items = list(self.active_pipelines.items())
+        active_pipelines = len(active_items)
         
         # Calculate average FPS and latency across active pipelines using real-time data
         avg_fps = 0
@@ -1109,34 +1330,46 @@ class PipelineManager:
             valid_fps_count = 0
             valid_latency_count = 0
             
-            for pipeline_id, pipeline_info in self.active_pipelines.items():
-                if 'pipeline_instance' in pipeline_info:
-                    pipeline_instance = pipeline_info['pipeline_instance']
-                    if hasattr(pipeline_instance, 'get_metrics'):
-                        try:
-                            metrics = pipeline_instance.get_metrics()
-                            fps = metrics.get('fps', 0)
-                            if fps > 0:
-                                total_fps += fps
-                                valid_fps_count += 1
-                            
-                            # Get actual inference latency from pipeline metrics
-                            latency = metrics.get('latency_ms', 0)
-                            if latency > 0:
-                                total_latency += latency
-                                valid_latency_count += 1
-                        except Exception as e:
-                            print(f"Error getting metrics for pipeline {pipeline_id}: {e}")
+            for pipeline_id, pipeline_info in active_items:
+                pipeline_instance = pipeline_info.get('pipeline_instance')
+                if pipeline_instance is None:
+                    continue
+                caps = pipeline_info['caps']
+                try:
+                    # Only FPS and latency are aggregated here, so skip the full metrics dict when possible
+                    if caps['get_performance']:
+                        metrics = pipeline_instance.get_performance()
+                    elif caps['get_metrics']:
+                        metrics = pipeline_instance.get_metrics()
+                    else:
+                        continue
+                    fps = metrics.get('fps', 0)
+                    if fps > 0:
+                        total_fps += fps
+                        valid_fps_count += 1
+                    
+                    # Get actual inference latency from pipeline metrics
+                    latency = metrics.get('latency_ms', 0)
+                    if latency > 0:
+                        total_latency += latency
+                        valid_latency_count += 1
+                except Exception as e:
+                    print(f"Error getting metrics for pipeline {pipeline_id}: {e}")
             
             if valid_fps_count > 0:
                 avg_fps = total_fps / valid_fps_count
             if valid_latency_count > 0:
                 avg_latency = total_latency / valid_latency_count
         
-        return {
+        stats = {
             'total': total_pipelines,
             'active': active_pipelines,
             'avg_fps': round(avg_fps, 1),
             'avg_latency': round(avg_latency, 0)
         }
+        with self._lock:
+            if self._cache_generation == generation:
+                self._stats_cache = stats
+                self._stats_cache_ts = now
+        return stats
 
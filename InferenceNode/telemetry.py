@@ -1,26 +1,133 @@
 import json
+import os
+import re
+import glob
 import time
 import uuid
 import psutil
 import platform
 import threading
 import logging
+import subprocess
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+try:
+    from .utils import parse_windows_platform
+except ImportError:
+    from InferenceNode.utils import parse_windows_platform
+
+try:
+    import orjson  # Optional fast JSON serializer for telemetry payloads
+except ImportError:
+    orjson = None
+
+# NVIDIA GPU metrics: prefer nvidia-ml-py, fall back to the deprecated pynvml
+_NVML_DEPRECATED = False
+try:
+    import nvidia_ml_py as nvml
+except ImportError:
+    try:
+        import pynvml as nvml
+        _NVML_DEPRECATED = True
+    except ImportError:
+        nvml = None
+
+try:
+    import wmi  # Windows CPU temperature fallback
+except ImportError:
+    wmi = None
+
+
+def _dumps(data: Dict[str, Any]):
+    """Serialize a telemetry payload (bytes with orjson, str otherwise - MQTT publish accepts both)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data)
+
+# PCI vendor IDs (as found in sysfs) for GPU vendors we can name without lspci
+_PCI_GPU_VENDORS = {
+    '0x10de': 'NVIDIA',
+    '0x1002': 'AMD',
+    '0x8086': 'Intel',
+}
+
+# Matches DRM card nodes (card0, card1, ...) but not their connectors (card0-HDMI-A-1)
+_DRM_CARD_RE = re.compile(r'card\d+$')
+
+# Common CPU temperature sensor names reported by psutil, in order of preference
+_CPU_TEMP_SENSORS = ('coretemp', 'cpu_thermal', 'k10temp', 'zenpower')
+
+# Linux exposes CPU and memory counters directly; elsewhere psutil is used
+_PROC_STAT = '/proc/stat'
+_PROC_MEMINFO = '/proc/meminfo'
+_PROC_NET_DEV = '/proc/net/dev'
+_HAS_PROC = os.path.isfile(_PROC_STAT) and os.path.isfile(_PROC_MEMINFO)
+_HAS_PROC_NET = os.path.isfile(_PROC_NET_DEV)
+
+
 class NodeTelemetry:
     """Handles node telemetry collection and publishing"""
     
+    # Fixed attribute set: cheaper attribute access on every tick and no per-instance __dict__
+    __slots__ = (
+        "node_id", "logger", "running", "telemetry_thread", "_stop_event",
+        "mqtt_client", "mqtt_topic", "mqtt_server", "mqtt_port", "_mqtt_credentials", "mqtt_retain",
+        "update_interval", "slow_interval", "_static_info", "_slow_info", "_last_slow_ts",
+        "_use_proc", "_use_proc_net", "_last_cpu_jiffies",
+        "_nvml", "_nvml_devices", "_nvml_driver_version", "_generic_gpu_cache",
+        "_temp_sensor", "_wmi_local", "_wmi_disabled",
+        "delta_publishing", "full_publish_every", "_publish_count", "_last_static_digest",
+    )
+    
     def __init__(self, node_id: str):
         self.node_id = node_id
         self.logger = logging.getLogger(self.__class__.__name__)
         self.running = False
         self.telemetry_thread = None
+        self._stop_event = threading.Event()  # Wakes the telemetry loop immediately on stop
         self.mqtt_client = None
         self.mqtt_topic = None
         self.mqtt_server = None
         self.mqtt_port = 1883
-        self.update_interval = 5.0  # seconds
+        self._mqtt_credentials = (None, None)
+        self.mqtt_retain = True  # Retain full payloads so new subscribers get the last known state immediately
+        self.update_interval = 5.0  # seconds - rate for fast-changing metrics (CPU, memory, network, GPU)
+        self.slow_interval = 60.0  # seconds - rate for slow-changing metrics (disk usage)
+        self._static_info = None  # Host facts that don't change while the process runs, see _get_static_info
+        self._slow_info = None  # Last slow-changing metrics, see _get_slow_info
+        self._last_slow_ts = 0.0
+        
+        # Prime psutil's CPU counters so the first non-blocking cpu_percent() call has a baseline
+        psutil.cpu_percent(interval=None)
+        
+        # Linux fast path: read /proc directly (disabled after the first failure), keeping the previous
+        # (busy, total) CPU jiffies to compute utilization between ticks
+        self._use_proc = _HAS_PROC
+        self._use_proc_net = _HAS_PROC_NET
+        self._last_cpu_jiffies = None
+        
+        # NVML state, initialized on first use: the bound module (None until initialized, False if unavailable),
+        # the per-device (handle, static attributes, unsupported metrics) entries and the driver version
+        self._nvml = None
+        self._nvml_devices = []
+        self._nvml_driver_version = None
+        
+        # Result of generic (non-NVML) GPU detection - the hardware doesn't change at runtime
+        self._generic_gpu_cache = None
+        
+        # CPU temperature sources: the psutil sensor that last gave a reading, and the WMI connection
+        # (per thread, since COM objects can't be shared across threads) unless WMI has already failed
+        self._temp_sensor = None
+        self._wmi_local = threading.local()
+        self._wmi_disabled = False
+        
+        # Delta publishing (opt-in): ticks publish only the changing counters to "<topic>/delta", and the
+        # full payload goes to "<topic>/full" when the fixed host facts change or every full_publish_every ticks
+        self.delta_publishing = False
+        self.full_publish_every = 60
+        self._publish_count = 0
+        self._last_static_digest = None
         
     def configure_mqtt(self, mqtt_server: str, mqtt_topic: str, 
                       mqtt_port: int = 1883, mqtt_username: Optional[str] = None,
@@ -29,18 +136,35 @@ class NodeTelemetry:
         try:
             import paho.mqtt.client as mqtt
             
-            # Store configuration
-            self.mqtt_server = mqtt_server
-            self.mqtt_port = mqtt_port
-            self.mqtt_topic = mqtt_topic
+            # Keep the existing long-lived connection when only the topic changed
+            credentials = (mqtt_username, mqtt_password)
+            if (self.mqtt_client is not None and self.mqtt_server == mqtt_server
+                    and self.mqtt_port == mqtt_port and self._mqtt_credentials == credentials):
+                self.mqtt_topic = mqtt_topic
+                self._last_static_digest = None  # Resend a full payload on the new topic
+                self.logger.info(f"MQTT telemetry topic updated: {mqtt_server}:{mqtt_port}/{mqtt_topic}")
+                return
+            
+            # Replacing the connection - stop the old client's network thread first
+            self._close_mqtt()
             
-            self.mqtt_client = mqtt.Client()
+            # Connect a new client before storing anything, so a failed connect leaves no
+            # half-configured client behind and a retry with the same settings reconnects
+            client = mqtt.Client()
             
             if mqtt_username and mqtt_password:
-                self.mqtt_client.username_pw_set(mqtt_username, mqtt_password)
+                client.username_pw_set(mqtt_username, mqtt_password)
             
-            self.mqtt_client.connect(mqtt_server, mqtt_port, 60)
-            self.mqtt_client.loop_start()
+            client.connect(mqtt_server, mqtt_port, 60)
+            client.loop_start()
+            
+            # Store configuration
+            self.mqtt_client = client
+            self.mqtt_server = mqtt_server
+            self.mqtt_port = mqtt_port
+            self.mqtt_topic = mqtt_topic
+            self._mqtt_credentials = credentials
+            self._last_static_digest = None  # Start the new connection with a full payload
             
             self.logger.info(f"MQTT telemetry configured: {mqtt_server}:{mqtt_port}/{mqtt_topic}")
             
@@ -49,60 +173,188 @@ class NodeTelemetry:
         except Exception as e:
             self.logger.error(f"MQTT telemetry configuration failed: {str(e)}")
     
-    def get_system_info(self) -> Dict[str, Any]:
-        """Collect system information"""
+    def _close_mqtt(self):
+        """Stop and disconnect the current MQTT client, if any"""
+        client, self.mqtt_client = self.mqtt_client, None
+        if client is None:
+            return
         try:
-            # CPU information
-            cpu_count = psutil.cpu_count()
-            cpu_freq = psutil.cpu_freq()
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            # Get CPU temperature if available
-            cpu_temp = self._get_cpu_temperature()
-            
-            # Memory information
-            memory = psutil.virtual_memory()
-            
-            # Disk information
-            disk = psutil.disk_usage('/')
-            
-            # Network information
-            network = psutil.net_io_counters()
-            
-            # GPU information (basic)
-            gpu_info = self._get_gpu_info()
-            
-            return {
-                "node_id": self.node_id,
-                "timestamp": datetime.utcnow().isoformat(),
+            client.loop_stop()
+            client.disconnect()
+        except Exception as e:
+            self.logger.debug(f"Error closing telemetry MQTT client: {str(e)}")
+    
+    def _get_static_info(self) -> Dict[str, Any]:
+        """Collect host information that is fixed for the life of the process (cached after the first call)"""
+        if self._static_info is None:
+            platform_raw = platform.platform()
+            self._static_info = {
                 "system": {
-                    "platform": self._parse_windows_platform(platform.platform()),
-                    "platform_raw": platform.platform(),
+                    "platform": parse_windows_platform(platform_raw),
+                    "platform_raw": platform_raw,
                     "processor": platform.processor(),
                     "architecture": platform.architecture()[0]
                 },
-                "cpu": {
-                    "count": cpu_count,
-                    "frequency_mhz": cpu_freq.current if cpu_freq else None,
-                    "usage_percent": cpu_percent,
-                    "temperature_c": cpu_temp
-                },
-                "memory": {
-                    "total_gb": round(memory.total / (1024**3), 2),
-                    "available_gb": round(memory.available / (1024**3), 2),
-                    "usage_percent": memory.percent
-                },
+                "cpu_count": psutil.cpu_count(),
+                "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2)
+            }
+        return self._static_info
+    
+    def _get_slow_info(self) -> Dict[str, Any]:
+        """Collect slow-changing metrics, refreshed at most once per slow_interval"""
+        now = time.monotonic()
+        if self._slow_info is None or now - self._last_slow_ts >= self.slow_interval:
+            # Disk information
+            disk = psutil.disk_usage('/')
+            self._slow_info = {
                 "disk": {
                     "total_gb": round(disk.total / (1024**3), 2),
                     "free_gb": round(disk.free / (1024**3), 2),
                     "usage_percent": round((disk.used / disk.total) * 100, 2)
-                },
-                "network": {
-                    "bytes_sent": network.bytes_sent,
-                    "bytes_recv": network.bytes_recv
-                },
-                "gpu": gpu_info
+                }
             }
+            self._last_slow_ts = now
+        return self._slow_info
+    
+    def _new_payload(self) -> Dict[str, Any]:
+        """Build a telemetry payload with every key present and the fixed host facts filled in"""
+        static_info = self._get_static_info()
+        return {
+            "node_id": self.node_id,
+            "timestamp": None,
+            "system": dict(static_info["system"]),
+            "cpu": {
+                "count": static_info["cpu_count"],
+                "frequency_mhz": None,
+                "usage_percent": None,
+                "temperature_c": None
+            },
+            "memory": {
+                "total_gb": static_info["memory_total_gb"],
+                "available_gb": None,
+                "usage_percent": None
+            },
+            "disk": {
+                "total_gb": None,
+                "free_gb": None,
+                "usage_percent": None
+            },
+            "network": {
+                "bytes_sent": None,
+                "bytes_recv": None
+            },
+            "gpu": None
+        }
+    
+    def _update_dynamic_info(self, payload: Dict[str, Any]):
+        """Collect fast-changing metrics into payload (from _new_payload), polled on every telemetry tick"""
+        # CPU information
+        cpu_freq = psutil.cpu_freq()
+        # CPU utilization since the previous tick, and memory availability
+        proc = self._read_proc_batch() if self._use_proc else None
+        if proc is not None:
+            cpu_percent, memory_available, memory_percent = proc
+        else:
+            # Non-blocking: utilization since the previous call (one telemetry interval in the loop)
+            cpu_percent = psutil.cpu_percent(interval=None)
+            memory = psutil.virtual_memory()
+            memory_available, memory_percent = memory.available, memory.percent
+        
+        # Network information
+        net_bytes = self._read_proc_net_dev() if self._use_proc_net else None
+        if net_bytes is None:
+            network = psutil.net_io_counters()
+            net_bytes = (network.bytes_sent, network.bytes_recv)
+        
+        cpu = payload["cpu"]
+        cpu["frequency_mhz"] = cpu_freq.current if cpu_freq else None
+        cpu["usage_percent"] = cpu_percent
+        # Get CPU temperature if available
+        cpu["temperature_c"] = self._get_cpu_temperature()
+        
+        memory_info = payload["memory"]
+        memory_info["available_gb"] = round(memory_available / (1024**3), 2)
+        memory_info["usage_percent"] = memory_percent
+        
+        network_info = payload["network"]
+        network_info["bytes_sent"], network_info["bytes_recv"] = net_bytes
+        
+        # GPU information (basic)
+        payload["gpu"] = self._get_gpu_info()
+    
+    def _read_proc_batch(self):
+        """Read CPU utilization and memory availability from /proc in one pass (Linux only)
+        
+        Returns (cpu_percent, memory_available_bytes, memory_percent), or None if /proc can't be used,
+        in which case the caller falls back to psutil for this and all later ticks.
+        """
+        try:
+            with open(_PROC_STAT, 'rb') as f:
+                cpu_line = f.readline()
+            with open(_PROC_MEMINFO, 'rb') as f:
+                meminfo = f.read()
+            
+            # cpu  user nice system idle iowait irq softirq steal [guest guest_nice] - guest time is
+            # already included in user/nice, so only the first eight columns count towards the total
+            jiffies = [int(v) for v in cpu_line.split()[1:9]]
+            total = sum(jiffies)
+            busy = total - jiffies[3] - jiffies[4]
+            
+            last, self._last_cpu_jiffies = self._last_cpu_jiffies, (busy, total)
+            if last is None:
+                # First sample: average since boot
+                cpu_percent = round(busy * 100.0 / total, 1) if total else 0.0
+            else:
+                delta_total = total - last[1]
+                cpu_percent = round(max(0.0, (busy - last[0]) * 100.0 / delta_total), 1) if delta_total > 0 else 0.0
+            
+            mem_total = mem_available = None
+            for line in meminfo.splitlines():
+                if line.startswith(b'MemTotal:'):
+                    mem_total = int(line.split()[1]) * 1024
+                elif line.startswith(b'MemAvailable:'):
+                    mem_available = int(line.split()[1]) * 1024
+                    break  # MemAvailable follows MemTotal
+            if not mem_total or mem_available is None:
+                raise ValueError("MemTotal/MemAvailable not found in /proc/meminfo")
+            memory_percent = round((mem_total - mem_available) * 100.0 / mem_total, 1)
+            
+            return cpu_percent, mem_available, memory_percent
+            
+        except Exception as e:
+            self.logger.debug(f"Falling back to psutil for CPU/memory counters: {str(e)}")
+            self._use_proc = False
+            return None
+    
+    def _read_proc_net_dev(self):
+        """Total (bytes_sent, bytes_recv) over all interfaces from /proc/net/dev, like psutil.net_io_counters()
+        
+        Returns None if the file can't be parsed, in which case psutil is used for this and all later ticks.
+        """
+        try:
+            with open(_PROC_NET_DEV, 'rb') as f:
+                lines = f.read().splitlines()[2:]  # Skip the two header lines
+            
+            sent = recv = 0
+            for line in lines:
+                # "  eth0: rx_bytes rx_packets ... (8 receive columns) tx_bytes ..."
+                fields = line.partition(b':')[2].split()
+                recv += int(fields[0])
+                sent += int(fields[8])
+            return sent, recv
+            
+        except Exception as e:
+            self.logger.debug(f"Falling back to psutil for network counters: {str(e)}")
+            self._use_proc_net = False
+            return None
+    
+    def _collect(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill payload (from _new_payload) with the current metrics, or return an error payload"""
+        try:
+            self._update_dynamic_info(payload)
+            payload["disk"].update(self._get_slow_info()["disk"])
+            payload["timestamp"] = datetime.utcnow().isoformat()
+            return payload
             
         except Exception as e:
             self.logger.error(f"Error collecting system info: {str(e)}")
@@ -112,39 +364,110 @@ class NodeTelemetry:
                 "error": str(e)
             }
     
+    def get_system_info(self) -> Dict[str, Any]:
+        """Collect system information"""
+        # Callers keep the result, so each one gets its own payload (the telemetry loop reuses one, see _telemetry_loop)
+        try:
+            payload = self._new_payload()
+        except Exception as e:
+            self.logger.error(f"Error collecting system info: {str(e)}")
+            return {
+                "node_id": self.node_id,
+                "timestamp": datetime.utcnow().isoformat(),
+                "error": str(e)
+            }
+        return self._collect(payload)
+    
+    @staticmethod
+    def _nvml_str(value) -> str:
+        """NVML returns bytes from older bindings and str from newer ones"""
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+    
+    def _init_nvml(self) -> bool:
+        """Initialize NVML once and cache device handles and static device attributes"""
+        if self._nvml is not None:
+            return self._nvml is not False
+        
+        if nvml is None:
+            # No NVIDIA libraries available
+            self._nvml = False
+            return False
+        if _NVML_DEPRECATED:
+            self.logger.warning("Using deprecated pynvml library. Consider installing nvidia-ml-py instead.")
+        
+        try:
+            nvml.nvmlInit()
+            devices = []
+            for i in range(nvml.nvmlDeviceGetCount()):
+                handle = nvml.nvmlDeviceGetHandleByIndex(i)
+                devices.append((handle, {
+                    "id": i,
+                    "name": self._nvml_str(nvml.nvmlDeviceGetName(handle)),
+                    "vendor": "NVIDIA"
+                }, set()))  # Metrics the device reported as not supported
+            try:
+                self._nvml_driver_version = self._nvml_str(nvml.nvmlSystemGetDriverVersion())
+            except Exception:
+                self._nvml_driver_version = None
+            self._nvml_devices = devices
+            self._nvml = nvml
+            return True
+        except Exception as e:
+            self.logger.debug(f"NVIDIA GPU initialization failed: {str(e)}")
+        self._nvml = False
+        return False
+    
+    def _shutdown_nvml(self):
+        """Release NVML if it was initialized"""
+        if self._nvml:
+            try:
+                self._nvml.nvmlShutdown()
+            except Exception as e:
+                self.logger.debug(f"NVML shutdown failed: {str(e)}")
+        self._nvml = None
+        self._nvml_devices = []
+        self._nvml_driver_version = None
+    
+    def _nvml_query(self, unsupported: set, metric: str, query, *args):
+        """Run an optional NVML query, remembering metrics the device reports as not supported"""
+        if metric in unsupported:
+            return None
+        try:
+            return query(*args)
+        except getattr(self._nvml, 'NVMLError_NotSupported', ()):
+            unsupported.add(metric)
+        except Exception:
+            pass
+        return None
+    
     def _get_gpu_info(self) -> Dict[str, Any]:
         """Get GPU information if available"""
-        gpu_info = {"available": False}
+        if not self._init_nvml():
+            # No usable NVIDIA GPU, try generic GPU detection
+            return self._get_generic_gpu_info()
         
-        # Try NVIDIA GPU first with the new library
+        nvml = self._nvml
         try:
-            import nvidia_ml_py as nvml
-            nvml.nvmlInit()
-            device_count = nvml.nvmlDeviceGetCount()
-            
             gpus = []
-            for i in range(device_count):
-                handle = nvml.nvmlDeviceGetHandleByIndex(i)
-                name = nvml.nvmlDeviceGetName(handle).decode('utf-8')
+            for handle, static_data, unsupported in self._nvml_devices:
                 memory_info = nvml.nvmlDeviceGetMemoryInfo(handle)
                 
-                # Get additional info if available
-                try:
-                    utilization = nvml.nvmlDeviceGetUtilizationRates(handle)
-                    temperature = nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU)
-                    power = nvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # Convert mW to W
-                except:
-                    utilization = None
-                    temperature = None
-                    power = None
+                # Get additional info if available - each metric independently, and metrics the device
+                # doesn't support (common on consumer and embedded boards) are not queried again
+                utilization = self._nvml_query(unsupported, "utilization", nvml.nvmlDeviceGetUtilizationRates, handle)
+                temperature = self._nvml_query(unsupported, "temperature", nvml.nvmlDeviceGetTemperature,
+                                               handle, nvml.NVML_TEMPERATURE_GPU)
+                power = self._nvml_query(unsupported, "power", nvml.nvmlDeviceGetPowerUsage, handle)
+                if power is not None:
+                    power = power / 1000.0  # Convert mW to W
                 
                 gpu_data = {
-                    "id": i,
-                    "name": name,
+                    "id": static_data["id"],
+                    "name": static_data["name"],
                     "memory_total_gb": round(memory_info.total / (1024**3), 2),
                     "memory_used_gb": round(memory_info.used / (1024**3), 2),
                     "memory_free_gb": round(memory_info.free / (1024**3), 2),
-                    "vendor": "NVIDIA"
+                    "vendor": static_data["vendor"]
                 }
                 
                 # Add optional metrics if available
@@ -158,152 +481,97 @@ class NodeTelemetry:
                 
                 gpus.append(gpu_data)
             
-            gpu_info = {"available": True, "devices": gpus, "driver_version": nvml.nvmlSystemGetDriverVersion().decode('utf-8')}
+            gpu_info = {"available": True, "devices": gpus}
+            if self._nvml_driver_version:
+                gpu_info["driver_version"] = self._nvml_driver_version
+            return gpu_info
             
-        except ImportError:
-            # Try fallback to deprecated pynvml if nvidia-ml-py not available
-            try:
-                import pynvml
-                pynvml.nvmlInit()
-                device_count = pynvml.nvmlDeviceGetCount()
-                
-                gpus = []
-                for i in range(device_count):
-                    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                    name = pynvml.nvmlDeviceGetName(handle).decode('utf-8')
-                    memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-                    
-                    gpus.append({
-                        "id": i,
-                        "name": name,
-                        "memory_total_gb": round(memory_info.total / (1024**3), 2),
-                        "memory_used_gb": round(memory_info.used / (1024**3), 2),
-                        "vendor": "NVIDIA"
-                    })
-                
-                gpu_info = {"available": True, "devices": gpus}
-                self.logger.warning("Using deprecated pynvml library. Consider installing nvidia-ml-py instead.")
-                
-            except ImportError:
-                # No NVIDIA libraries available, try generic GPU detection
-                gpu_info = self._get_generic_gpu_info()
-            except Exception as e:
-                self.logger.debug(f"Fallback GPU info collection failed: {str(e)}")
-                gpu_info = self._get_generic_gpu_info()
-                
         except Exception as e:
             self.logger.debug(f"NVIDIA GPU info collection failed: {str(e)}")
             # Try generic GPU detection as fallback
-            gpu_info = self._get_generic_gpu_info()
+            return self._get_generic_gpu_info()
+    
+    def _scan_drm_gpus(self) -> Optional[list]:
+        """List GPUs from /sys/class/drm; None if sysfs is not available"""
+        drm_cards = [path for path in glob.glob('/sys/class/drm/card[0-9]*')
+                     if _DRM_CARD_RE.match(os.path.basename(path))]
+        if not drm_cards:
+            return None
         
-        return gpu_info
+        gpu_devices = []
+        for card_path in sorted(drm_cards):
+            try:
+                with open(os.path.join(card_path, 'device', 'vendor')) as f:
+                    vendor_id = f.read().strip()
+                with open(os.path.join(card_path, 'device', 'device')) as f:
+                    device_id = f.read().strip()
+            except OSError:
+                continue
+            vendor = _PCI_GPU_VENDORS.get(vendor_id, "Unknown")
+            gpu_devices.append({
+                "name": f"{vendor if vendor != 'Unknown' else vendor_id} device {device_id}",
+                "vendor": vendor,
+                "memory_total_gb": "Unknown"
+            })
+        return gpu_devices
+    
+    def _scan_lspci_gpus(self) -> list:
+        """List GPUs by parsing lspci output"""
+        gpu_devices = []
+        try:
+            result = subprocess.run(['lspci', '-nn'], capture_output=True, text=True, timeout=5)
+            if result.returncode == 0:
+                lines = result.stdout.split('\n')
+                for line in lines:
+                    if 'VGA' in line or 'Display controller' in line:
+                        # Extract GPU name from lspci output
+                        parts = line.split(': ')
+                        if len(parts) > 1:
+                            gpu_name = parts[1].split('[')[0].strip()
+                            gpu_devices.append({
+                                "name": gpu_name,
+                                "vendor": "Unknown",
+                                "memory_total_gb": "Unknown"
+                            })
+        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+            pass
+        return gpu_devices
     
     def _get_generic_gpu_info(self) -> Dict[str, Any]:
-        """Get generic GPU information without NVIDIA-specific libraries"""
+        """Get generic GPU information without NVIDIA-specific libraries (detected once, then cached)"""
+        if self._generic_gpu_cache is not None:
+            return self._generic_gpu_cache
+        
         try:
             # Try to get basic GPU info from system
             gpu_devices = []
             
-            # On Linux, try reading from /proc or lspci if available
+            # On Linux, read the DRM devices from sysfs, falling back to lspci if sysfs isn't available
             if platform.system() == "Linux":
-                try:
-                    import subprocess
-                    result = subprocess.run(['lspci', '-nn'], capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        lines = result.stdout.split('\n')
-                        for line in lines:
-                            if 'VGA' in line or 'Display controller' in line:
-                                # Extract GPU name from lspci output
-                                parts = line.split(': ')
-                                if len(parts) > 1:
-                                    gpu_name = parts[1].split('[')[0].strip()
-                                    gpu_devices.append({
-                                        "name": gpu_name,
-                                        "vendor": "Unknown",
-                                        "memory_total_gb": "Unknown"
-                                    })
-                except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-                    pass
+                gpu_devices = self._scan_drm_gpus()
+                if gpu_devices is None:
+                    gpu_devices = self._scan_lspci_gpus()
             
             if gpu_devices:
-                return {"available": True, "devices": gpu_devices, "detection_method": "generic"}
+                gpu_info = {"available": True, "devices": gpu_devices, "detection_method": "generic"}
             else:
-                return {"available": False, "message": "No GPU detection method available"}
+                gpu_info = {"available": False, "message": "No GPU detection method available"}
                 
         except Exception as e:
             self.logger.debug(f"Generic GPU detection failed: {str(e)}")
-            return {"available": False, "message": "GPU detection failed"}
+            gpu_info = {"available": False, "message": "GPU detection failed"}
+        
+        self._generic_gpu_cache = gpu_info
+        return gpu_info
     
-    def _parse_windows_platform(self, platform_string: str) -> str:
-        """Parse Windows platform string to readable format"""
-        try:
-            # Windows version mapping
-            windows_versions = {
-                "6.1.7600": "Windows 7",
-                "6.1.7601": "Windows 7 with Service Pack 1",
-                "6.2.9200": "Windows 8",
-                "6.3.9200": "Windows 8.1",
-                "6.3.9600": "Windows 8.1 with Update 1",
-                "10.0.10240": "Windows 10 Version 1507",
-                "10.0.10586": "Windows 10 Version 1511 (November Update)",
-                "10.0.14393": "Windows 10 Version 1607 (Anniversary Update)",
-                "10.0.15063": "Windows 10 Version 1703 (Creators Update)",
-                "10.0.16299": "Windows 10 Version 1709 (Fall Creators Update)",
-                "10.0.17134": "Windows 10 Version 1803 (April 2018 Update)",
-                "10.0.17763": "Windows 10 Version 1809 (October 2018 Update)",
-                "10.0.18362": "Windows 10 Version 1903 (May 2019 Update)",
-                "10.0.18363": "Windows 10 Version 1909 (November 2019 Update)",
-                "10.0.19041": "Windows 10 Version 2004 (May 2020 Update)",
-                "10.0.19042": "Windows 10 Version 20H2 (October 2020 Update)",
-                "10.0.19043": "Windows 10 Version 21H1 (May 2021 Update)",
-                "10.0.19044": "Windows 10 Version 21H2 (November 2021 Update)",
-                "10.0.19045": "Windows 10 Version 22H2 (2022 Update)",
-                "10.0.20348": "Windows Server 2022 Version 21H2",
-                "10.0.22000": "Windows 11 Version 21H2 (original release)",
-                "10.0.22621": "Windows 11 Version 22H2 (2022 Update)",
-                "10.0.22631": "Windows 11 Version 23H2 (2023 Update)",
-                "10.0.26100": "Windows 11 Version 24H2 (2024 Update)"
-            }
-            
-            # Check if this is a Windows platform string
-            if not platform_string.startswith("Windows"):
-                return platform_string
-            
-            # Extract version number from platform string
-            # Format: Windows-10-10.0.26100-SP0
-            import re
-            version_match = re.search(r'(\d+\.\d+\.\d+)', platform_string)
-            
-            if version_match:
-                version = version_match.group(1)
-                readable_version = windows_versions.get(version)
-                
-                if readable_version:
-                    # Check if it's a server version based on platform string
-                    if "Server" in platform_string or any(server_indicator in platform_string.lower() 
-                                                         for server_indicator in ["datacenter", "standard", "enterprise"]):
-                        # Handle server versions
-                        if version == "6.1.7600" or version == "6.1.7601":
-                            return "Windows Server 2008 R2" + (" with Service Pack 1" if version == "6.1.7601" else "")
-                        elif version == "6.2.9200":
-                            return "Windows Server 2012"
-                        elif version == "6.3.9200" or version == "6.3.9600":
-                            return "Windows Server 2012 R2"
-                        elif version == "10.0.14393":
-                            return "Windows Server 2016"
-                        elif version == "10.0.17763":
-                            return "Windows Server 2019"
-                        elif version == "10.0.20348":
-                            return "Windows Server 2022 Version 21H2"
-                    
-                    return readable_version
-            
-            # If no match found, return original string
-            return platform_string
-            
-        except Exception as e:
-            self.logger.debug(f"Platform parsing failed: {str(e)}")
-            return platform_string
+    @staticmethod
+    def _read_sensor(sensor_list) -> Optional[float]:
+        """Get the first sensor reading (usually package temp) if it is valid"""
+        if sensor_list:
+            temp = sensor_list[0].current
+            if temp and temp > 0:
+                return round(temp, 1)
+        return None
     
     def _get_cpu_temperature(self):
         """Get CPU temperature in Celsius"""
@@ -313,41 +581,37 @@ class NodeTelemetry:
                 temps = psutil.sensors_temperatures()
                 
                 if temps:
-                    # Try common CPU temperature sensor names
-                    cpu_sensors = ['coretemp', 'cpu_thermal', 'k10temp', 'zenpower']
+                    # Reuse the sensor that worked last time
+                    if self._temp_sensor in temps:
+                        temp = self._read_sensor(temps[self._temp_sensor])
+                        if temp is not None:
+                            return temp
                     
-                    for sensor_name in cpu_sensors:
-                        if sensor_name in temps:
-                            sensor_list = temps[sensor_name]
-                            if sensor_list:
-                                # Get the first sensor reading (usually package temp)
-                                temp = sensor_list[0].current
-                                if temp and temp > 0:
-                                    return round(temp, 1)
-                    
-                    # If no specific CPU sensors found, try the first available sensor
-                    for sensor_name, sensor_list in temps.items():
-                        if sensor_list:
-                            temp = sensor_list[0].current
-                            if temp and temp > 0:
-                                return round(temp, 1)
+                    # Try common CPU temperature sensor names, then the first available sensor
+                    candidates = [name for name in _CPU_TEMP_SENSORS if name in temps]
+                    candidates.extend(name for name in temps if name not in _CPU_TEMP_SENSORS)
+                    for sensor_name in candidates:
+                        temp = self._read_sensor(temps[sensor_name])
+                        if temp is not None:
+                            self._temp_sensor = sensor_name
+                            return temp
             
-            # Windows alternative using WMI (if available)
-            if platform.system() == "Windows":
+            # Windows alternative using WMI (if available); skipped for good once it has failed
+            if wmi is not None and not self._wmi_disabled and platform.system() == "Windows":
                 try:
-                    import wmi
-                    w = wmi.WMI(namespace="root\\wmi")
-                    temperature_infos = w.MSAcpi_ThermalZoneTemperature()
+                    wmi_conn = getattr(self._wmi_local, 'conn', None)
+                    if wmi_conn is None:
+                        wmi_conn = self._wmi_local.conn = wmi.WMI(namespace="root\\wmi")
+                    temperature_infos = wmi_conn.MSAcpi_ThermalZoneTemperature()
                     if temperature_infos:
                         # Convert from tenths of Kelvin to Celsius
                         temp_kelvin = temperature_infos[0].CurrentTemperature / 10.0
                         temp_celsius = temp_kelvin - 273.15
                         if temp_celsius > 0 and temp_celsius < 150:  # Sanity check
                             return round(temp_celsius, 1)
-                except ImportError:
-                    pass  # WMI not available
-                except Exception:
-                    pass  # WMI query failed
+                except Exception as e:
+                    self._wmi_disabled = True  # WMI query failed (commonly unsupported or needs admin rights)
+                    self.logger.debug(f"WMI temperature query failed, not retrying: {str(e)}")
                         
         except Exception as e:
             self.logger.debug(f"CPU temperature collection failed: {str(e)}")
@@ -360,6 +624,9 @@ class NodeTelemetry:
             return
             
         self.running = True
+        self._stop_event.clear()
+        self._publish_count = 0
+        self._last_static_digest = None
         self.telemetry_thread = threading.Thread(target=self._telemetry_loop, daemon=True)
         self.telemetry_thread.start()
         self.logger.info("Telemetry started")
@@ -367,23 +634,86 @@ class NodeTelemetry:
     def stop_telemetry(self):
         """Stop telemetry collection"""
         self.running = False
+        self._stop_event.set()
         if self.telemetry_thread:
             self.telemetry_thread.join(timeout=5)
+        self._shutdown_nvml()
         self.logger.info("Telemetry stopped")
     
+    @staticmethod
+    def _split_payload(data: Dict[str, Any]):
+        """Split a get_system_info() payload into its fixed host facts and its changing counters"""
+        cpu = data.get("cpu", {})
+        memory = data.get("memory", {})
+        disk = data.get("disk", {})
+        static_fields = {
+            "system": data.get("system"),
+            "cpu_count": cpu.get("count"),
+            "memory_total_gb": memory.get("total_gb"),
+            "disk_total_gb": disk.get("total_gb")
+        }
+        dynamic_fields = {
+            "node_id": data.get("node_id"),
+            "timestamp": data.get("timestamp"),
+            "cpu": {k: v for k, v in cpu.items() if k != "count"},
+            "memory": {k: v for k, v in memory.items() if k != "total_gb"},
+            "disk": {k: v for k, v in disk.items() if k != "total_gb"},
+            "network": data.get("network"),
+            "gpu": data.get("gpu")
+        }
+        return static_fields, dynamic_fields
+    
+    def _publish_telemetry(self, telemetry_data: Dict[str, Any]):
+        """Publish one telemetry sample, as a full payload or (with delta_publishing) as a delta"""
+        client = self.mqtt_client
+        if client is None:  # Reconfigured concurrently
+            return
+        if not self.delta_publishing or "error" in telemetry_data:
+            client.publish(self.mqtt_topic, _dumps(telemetry_data), qos=0, retain=self.mqtt_retain)
+            return
+        
+        static_fields, dynamic_fields = self._split_payload(telemetry_data)
+        static_digest = hash(_dumps(static_fields))
+        heartbeat = self._publish_count % max(1, int(self.full_publish_every)) == 0
+        self._publish_count += 1
+        
+        if heartbeat or static_digest != self._last_static_digest:
+            self._last_static_digest = static_digest
+            client.publish(f"{self.mqtt_topic}/full", _dumps(telemetry_data), qos=0, retain=self.mqtt_retain)
+        else:
+            # Deltas are only meaningful on top of a full payload, so they are never retained
+            client.publish(f"{self.mqtt_topic}/delta", _dumps(dynamic_fields), qos=0)
+    
     def _telemetry_loop(self):
         """Main telemetry collection loop"""
+        # Reused every tick: only this thread touches it, and it is serialized before the next tick
+        payload = None
+        # Ticks are scheduled against a monotonic deadline so collection time doesn't stretch the period
+        next_tick = time.monotonic()
+        behind = False  # Whether the previous tick overran the interval
         while self.running:
             try:
-                telemetry_data = self.get_system_info()
+                if payload is None:
+                    payload = self._new_payload()
+                telemetry_data = self._collect(payload)
                 
                 if self.mqtt_client and self.mqtt_topic:
-                    message = json.dumps(telemetry_data)
-                    self.mqtt_client.publish(self.mqtt_topic, message)
+                    self._publish_telemetry(telemetry_data)
                     self.logger.debug("Telemetry published to MQTT")
                 
-                time.sleep(self.update_interval)
-                
             except Exception as e:
                 self.logger.error(f"Telemetry loop error: {str(e)}")
-                time.sleep(self.update_interval)
+            
+            next_tick += self.update_interval
+            now = time.monotonic()
+            if now > next_tick:
+                # Overran the interval - start over from now rather than firing a burst of catch-up ticks.
+                # Warn when falling behind starts; repeats while still behind only go to debug
+                log = self.logger.debug if behind else self.logger.warning
+                log(f"Telemetry collection overran the {self.update_interval}s interval by {now - next_tick:.2f}s")
+                behind = True
+                next_tick = now
+            elif behind:
+                self.logger.info("Telemetry collection caught up with the update interval")
+                behind = False
+            self._stop_event.wait(next_tick - now)
@@ -1,50 +1,125 @@
-# Import all destination classes from their individual modules
+import os
+import copy
+import importlib
+import importlib.util
+
+# Import the base class and publisher eagerly; destination plugins are imported
+# on first access (PEP 562) so only the backends actually used pay their
+# import cost (paho, rclpy, asyncua, pyzmq, ...)
 from .base_destination import BaseResultDestination
-from .plugins.null_destination import NullDestination
-from .plugins.mqtt_destination import MQTTDestination
-from .plugins.webhook_destination import WebhookDestination
-from .plugins.serial_destination import SerialDestination
-from .plugins.folder_destination import FolderDestination
-from .plugins.zeromq_destination import ZeroMQDestination
-from .plugins.opcua_destination import OPCUADestination
-from .plugins.ros2_destination import ROS2Destination
-from .plugins.roboflow_destination import RoboflowDestination
-from .plugins.geti_destination import GetiDestination
 from .publisher import ResultPublisher
 
+_PLUGIN_MODULES = {
+    'NullDestination': '.plugins.null_destination',
+    'MQTTDestination': '.plugins.mqtt_destination',
+    'WebhookDestination': '.plugins.webhook_destination',
+    'SerialDestination': '.plugins.serial_destination',
+    'FolderDestination': '.plugins.folder_destination',
+    'ZeroMQDestination': '.plugins.zeromq_destination',
+    'OPCUADestination': '.plugins.opcua_destination',
+    'ROS2Destination': '.plugins.ros2_destination',
+    'RoboflowDestination': '.plugins.roboflow_destination',
+    'GetiDestination': '.plugins.geti_destination',
+}
+
+
+# Third-party modules each destination needs at runtime, keyed by destination
+# type. Checked with find_spec so probing availability never imports them.
+_REQUIRED_MODULES = {
+    'mqtt': ('paho',),
+    'webhook': ('requests',),
+    'serial': ('serial',),
+    'zeromq': ('zmq',),
+    'opcua': ('asyncua',),
+    'ros2': ('rclpy', 'std_msgs'),
+    'roboflow': ('roboflow',),
+    'geti': ('geti_sdk',),
+}
+
+_cached_destination_types = None
+
+
+def __getattr__(name: str):
+    """Import a destination plugin class on first access and cache it in the module namespace"""
+    module_name = _PLUGIN_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PLUGIN_MODULES))
+
+
+def _destination_class(class_name: str):
+    """Resolve a destination class by name, importing its plugin module if needed"""
+    cls = globals().get(class_name)
+    return cls if cls is not None else __getattr__(class_name)
+
+
+# Set INFERENCE_NODE_EAGER_IMPORT=1 to import every plugin up front (useful for
+# surfacing plugin import errors at startup while debugging)
+if os.environ.get('INFERENCE_NODE_EAGER_IMPORT', '').lower() in ('1', 'true', 'yes'):
+    for _class_name in _PLUGIN_MODULES:
+        _destination_class(_class_name)
+
 def ResultDestination(destination_type: str):
     """Factory function to create result destinations"""
     destinations = {
-        'mqtt': MQTTDestination,
-        'webhook': WebhookDestination,
-        'serial': SerialDestination,
-        'file': FolderDestination,
-        'folder': FolderDestination,
-        'zmq': ZeroMQDestination,
-        'zeromq': ZeroMQDestination,
-        'opcua': OPCUADestination,
-        'opc-ua': OPCUADestination,
-        'ros2': ROS2Destination,
-        'ros': ROS2Destination,
-        'roboflow': RoboflowDestination,
-        'geti': GetiDestination,
-        'null': NullDestination
+        'mqtt': 'MQTTDestination',
+        'webhook': 'WebhookDestination',
+        'serial': 'SerialDestination',
+        'file': 'FolderDestination',
+        'folder': 'FolderDestination',
+        'zmq': 'ZeroMQDestination',
+        'zeromq': 'ZeroMQDestination',
+        'opcua': 'OPCUADestination',
+        'opc-ua': 'OPCUADestination',
+        'ros2': 'ROS2Destination',
+        'ros': 'ROS2Destination',
+        'roboflow': 'RoboflowDestination',
+        'geti': 'GetiDestination',
+        'null': 'NullDestination'
     }
     
     if destination_type not in destinations:
         raise ValueError(f"Unsupported destination type: {destination_type}. Available: {list(destinations.keys())}")
     
-    return destinations[destination_type]()
+    return _destination_class(destinations[destination_type])()
+
+def _missing_modules(destination_type: str):
+    """Required modules for a destination type that are not installed"""
+    missing = []
+    for module_name in _REQUIRED_MODULES.get(destination_type, ()):
+        try:
+            if importlib.util.find_spec(module_name) is None:
+                missing.append(module_name)
+        except (ImportError, ValueError):
+            missing.append(module_name)
+    return missing
+
+
+def clear_destination_type_cache():
+    """Forget the cached destination types so the next call re-probes availability"""
+    global _cached_destination_types
+    _cached_destination_types = None
+
 
 def get_available_destination_types():
-    """Get list of available destination types with metadata"""
+    """Get list of available destination types with metadata (computed once and cached)"""
+    global _cached_destination_types
+    if _cached_destination_types is not None:
+        return copy.deepcopy(_cached_destination_types)
+
     destination_metadata = [
         {
             'type': 'mqtt',
             'name': 'MQTT',
             'description': 'Publish results to an MQTT broker',
             'icon': 'fas fa-broadcast-tower',
-            'class': MQTTDestination,
+            'class': 'MQTTDestination',
             'primary': True
         },
         {
@@ -52,7 +127,7 @@ def get_available_destination_types():
             'name': 'Webhook',
             'description': 'Send HTTP POST requests to a web endpoint',
             'icon': 'fas fa-globe',
-            'class': WebhookDestination,
+            'class': 'WebhookDestination',
             'primary': True
         },
         {
@@ -60,7 +135,7 @@ def get_available_destination_types():
             'name': 'Serial Port',
             'description': 'Send data over a serial connection',
             'icon': 'fas fa-plug',
-            'class': SerialDestination,
+            'class': 'SerialDestination',
             'primary': True
         },
         {
@@ -68,7 +143,7 @@ def get_available_destination_types():
             'name': 'File/Folder',
             'description': 'Save results to files in a directory',
             'icon': 'fas fa-folder',
-            'class': FolderDestination,
+            'class': 'FolderDestination',
             'primary': True
         },
         {
@@ -76,7 +151,7 @@ def get_available_destination_types():
             'name': 'ZeroMQ',
             'description': 'Publish via ZeroMQ messaging',
             'icon': 'fas fa-exchange-alt',
-            'class': ZeroMQDestination,
+            'class': 'ZeroMQDestination',
             'primary': False
         },
         {
@@ -84,7 +159,7 @@ def get_available_destination_types():
             'name': 'OPC-UA',
             'description': 'Publish to OPC-UA server',
             'icon': 'fas fa-industry',
-            'class': OPCUADestination,
+            'class': 'OPCUADestination',
             'primary': False
         },
         {
@@ -92,7 +167,7 @@ def get_available_destination_types():
             'name': 'ROS2',
             'description': 'Publish to ROS2 topics',
             'icon': 'fas fa-robot',
-            'class': ROS2Destination,
+            'class': 'ROS2Destination',
             'primary': False
         },
         {
@@ -100,7 +175,7 @@ def get_available_destination_types():
             'name': 'Roboflow',
             'description': 'Upload images to Roboflow workspace',
             'icon': 'fas fa-cloud-upload-alt',
-            'class': RoboflowDestination,
+            'class': 'RoboflowDestination',
             'primary': True
         },
         {
@@ -108,7 +183,7 @@ def get_available_destination_types():
             'name': 'Geti',
             'description': 'Upload images to Geti platform',
             'icon': 'fas fa-microchip',
-            'class': GetiDestination,
+            'class': 'GetiDestination',
             'primary': True
         },
         {
@@ -116,21 +191,23 @@ def get_available_destination_types():
             'name': 'Null (Discard)',
             'description': 'Discard all results (for testing)',
             'icon': 'fas fa-trash-alt',
-            'class': NullDestination,
+            'class': 'NullDestination',
             'primary': False
         }
     ]
     
-    # Filter out destinations where the class isn't available (import failed)
+    # Mark destinations unavailable when their dependencies are not installed
     available_destinations = []
     for dest in destination_metadata:
         try:
-            # Try to instantiate the class to check if dependencies are available
-            test_instance = dest['class']()
+            missing = _missing_modules(dest['type'])
+            if missing:
+                raise ImportError(f"Missing required module(s): {', '.join(missing)}")
+            dest_class = _destination_class(dest['class'])
             
             # Get configuration schema from the class
             try:
-                config_schema = dest['class'].get_config_schema()
+                config_schema = dest_class.get_config_schema()
             except Exception as e:
                 config_schema = {
                     'fields': [],
@@ -162,7 +239,8 @@ def get_available_destination_types():
                 }
             })
 
-    return available_destinations
+    _cached_destination_types = available_destinations
+    return copy.deepcopy(available_destinations)
 
 __all__ = [
     'ResultDestination', 
@@ -178,5 +256,6 @@ __all__ = [
     'RoboflowDestination',
     'GetiDestination',
     'NullDestination',
-    'get_available_destination_types'
+    'get_available_destination_types',
+    'clear_destination_type_cache'
 ]
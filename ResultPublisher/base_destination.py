@@ -7,6 +7,54 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 from datetime import datetime
 
+# Hostname for {hostname} substitution, resolved once rather than on every publish
+_HOSTNAME = socket.gethostname()
+
+
+def refresh_hostname() -> str:
+    """Re-read the system hostname (e.g. after a container rename) and return it"""
+    global _HOSTNAME, _time_var_cache
+    _HOSTNAME = socket.gethostname()
+    _time_var_cache = (-1, None)
+    return _HOSTNAME
+
+
+class _SafeFormatDict(dict):
+    """Mapping for str.format_map that leaves unknown {placeholders} in place"""
+    
+    def __missing__(self, key: str) -> str:
+        return '{' + key + '}'
+
+
+# Time-derived substitution variables, rebuilt at most once per second and
+# shared by all destinations: (unix second, variables)
+_time_var_cache = (-1, None)
+
+
+def _default_variables() -> Dict[str, Any]:
+    """Fresh copy of the default substitution variables for the current second"""
+    global _time_var_cache
+    unix_time = int(time.time())
+    cached_second, variables = _time_var_cache
+    if cached_second != unix_time:
+        now = datetime.utcnow()
+        variables = {
+            # Time-based variables (always available)
+            'timestamp': now.isoformat(),
+            'date': now.strftime('%Y-%m-%d'),
+            'time': now.strftime('%H:%M:%S'),
+            'unix_time': str(unix_time),
+            'hostname': _HOSTNAME,
+            
+            # Default values for common variables
+            'node_id': 'unknown-node',
+            'node_name': 'InferNode',
+            'pipeline_id': 'unknown-pipeline',
+            'model_name': 'unknown-model'
+        }
+        _time_var_cache = (unix_time, variables)
+    return variables.copy()
+
 
 class BaseResultDestination(ABC):
     """Base class for all result destinations"""
@@ -15,7 +63,7 @@ class BaseResultDestination(ABC):
         self.type = self.__class__.__name__
         self.logger = logging.getLogger(self.__class__.__name__)
         self.rate_limit = None
-        self.last_publish_time = 0
+        self._next_publish_at = 0.0  # time.monotonic() before which rate limiting blocks publishing
         self.is_configured = False
         self._id: Optional[str] = None  # Unique identifier for this destination
         self.enabled = True  # Whether this destination is enabled
@@ -125,12 +173,6 @@ class BaseResultDestination(ABC):
         self.success_count_since_failure = 0
         self.last_failure_time = time.time()
         
-        # Ensure types are integers (defensive programming)
-        if not isinstance(self.failure_count, int):
-            self.failure_count = int(self.failure_count) if str(self.failure_count).isdigit() else 0
-        if not isinstance(self.max_failures, int):
-            self.max_failures = int(self.max_failures) if str(self.max_failures).isdigit() else 5
-        
         if self.failure_count >= self.max_failures and not self.failure_threshold_reached:
             self.failure_threshold_reached = True
             self.enabled = False
@@ -143,12 +185,6 @@ class BaseResultDestination(ABC):
         """Record a successful publish and potentially reset failure count"""
         self.success_count_since_failure += 1
         
-        # Ensure types are integers (defensive programming)
-        if not isinstance(self.success_count_since_failure, int):
-            self.success_count_since_failure = int(self.success_count_since_failure) if str(self.success_count_since_failure).isdigit() else 0
-        if not isinstance(self.failure_count, int):
-            self.failure_count = int(self.failure_count) if str(self.failure_count).isdigit() else 0
-        
         # Reset failure count after some successful publishes
         if self.success_count_since_failure >= 3 and self.failure_count > 0:
             self.logger.info(f"Resetting failure count after {self.success_count_since_failure} successful publishes")
@@ -160,11 +196,29 @@ class BaseResultDestination(ABC):
             if self.failure_threshold_reached:
                 self.logger.info("Destination was auto-disabled due to failures. Please manually re-enable when ready.")
 
+    @staticmethod
+    def _as_int(value: Any, default: int) -> int:
+        """Convert a counter that may have been loaded as a string back to an int"""
+        if isinstance(value, int):
+            return value
+        return int(value) if str(value).isdigit() else default
+
+    def _coerce_state(self) -> None:
+        """
+        Normalise counter types once (config loaded from JSON may hold strings) so
+        the per-publish paths can use them without checking.
+        """
+        self.failure_count = self._as_int(self.failure_count, 0)
+        self.max_failures = self._as_int(self.max_failures, 5)
+        self.success_count_since_failure = self._as_int(self.success_count_since_failure, 0)
+        self.frame_count = self._as_int(self.frame_count, 0)
+
     def reset_failure_count(self) -> None:
         """Manually reset failure count and re-enable if auto-disabled"""
         self.failure_count = 0
         self.success_count_since_failure = 0
         self.failure_threshold_reached = False
+        self._coerce_state()
         if not self.enabled and self.is_configured:
             self.enabled = True
             self.logger.info("Destination manually re-enabled and failure count reset")
@@ -174,14 +228,17 @@ class BaseResultDestination(ABC):
         self.frame_count = 0
         self.frame_limit_reached = False
         self._pause_warning_logged = False
+        self._coerce_state()
         self.logger.info("Destination frame count reset and unpaused")
     
     def set_max_frames(self, max_frames: Optional[int]) -> None:
         """Set maximum number of frames before auto-disable (None or 0 for unlimited)"""
-        if max_frames is not None and max_frames > 0:
-            self.max_frames = int(max_frames)
-        else:
-            self.max_frames = None
+        try:
+            max_frames = int(max_frames) if max_frames not in (None, '') else None
+        except (TypeError, ValueError):
+            self.logger.warning(f"Invalid max_frames {max_frames!r}, disabling frame limit")
+            max_frames = None
+        self.max_frames = max_frames if max_frames is not None and max_frames > 0 else None
 
     def set_context_variables(self, **kwargs) -> None:
         """Set context variables for string substitution"""
@@ -190,21 +247,7 @@ class BaseResultDestination(ABC):
 
     def get_available_variables(self, additional_vars: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get all available variables for substitution (useful for debugging)"""
-        now = datetime.utcnow()
-        variables = {
-            # Time-based variables (always available)
-            'timestamp': now.isoformat(),
-            'date': now.strftime('%Y-%m-%d'),
-            'time': now.strftime('%H:%M:%S'),
-            'unix_time': str(int(time.time())),
-            'hostname': socket.gethostname(),
-            
-            # Default values for common variables
-            'node_id': 'unknown-node',
-            'node_name': 'InferNode',
-            'pipeline_id': 'unknown-pipeline',
-            'model_name': 'unknown-model'
-        }
+        variables = _default_variables()
         
         # Override defaults with context variables
         if self.context_variables:
@@ -230,25 +273,12 @@ class BaseResultDestination(ABC):
         - {unix_time}: Unix timestamp
         - Any custom variables set via set_context_variables()
         """
-        if not text:
+        # Most topics and paths are plain strings; skip building variables for them
+        if not text or '{' not in text:
             return text
             
         # Build substitution variables with defaults
-        now = datetime.utcnow()
-        variables = {
-            # Time-based variables (always available)
-            'timestamp': now.isoformat(),
-            'date': now.strftime('%Y-%m-%d'),
-            'time': now.strftime('%H:%M:%S'),
-            'unix_time': str(int(time.time())),
-            'hostname': socket.gethostname(),
-            
-            # Default values for common variables
-            'node_id': 'unknown-node',
-            'node_name': 'InferNode',
-            'pipeline_id': 'unknown-pipeline',
-            'model_name': 'unknown-model'
-        }
+        variables = _default_variables()
         
         # Override defaults with context variables
         if self.context_variables:
@@ -259,41 +289,27 @@ class BaseResultDestination(ABC):
             variables.update(additional_vars)
         
         try:
-            # Use str.format() for variable substitution
-            return text.format(**variables)
-        except KeyError as e:
-            self.logger.warning(f"Variable substitution failed - unknown variable: {e}")
-            return text
+            # Unknown variables are left as-is instead of failing the whole substitution
+            return text.format_map(_SafeFormatDict(variables))
         except Exception as e:
             self.logger.warning(f"Variable substitution failed: {str(e)}")
             return text
 
     def set_rate_limit(self, rate_limit: Optional[float]) -> None:
         """Set rate limit as minimum seconds between publishes (0 or None for unlimited)"""
-        self.rate_limit = rate_limit
+        try:
+            self.rate_limit = float(rate_limit) if rate_limit not in (None, '') else None
+        except (TypeError, ValueError):
+            self.logger.warning(f"Invalid rate_limit {rate_limit!r}, disabling rate limiting")
+            self.rate_limit = None
+        self._next_publish_at = 0.0  # Apply the new limit from the next publish
     
     def can_publish(self) -> bool:
         """Check if enough time has passed since last publish (based on rate_limit in seconds) and if destination is enabled"""
-        try:
-            if not self.enabled:
-                return False
-            
-            # Check if paused due to frame limit
-            if self.frame_limit_reached:
-                return False
-                
-            if self.rate_limit is None:
-                return True
-            
-            # Ensure types are numeric (defensive programming)
-            current_time = time.time()
-            rate_limit = float(self.rate_limit) if self.rate_limit is not None else 0
-            last_publish_time = float(self.last_publish_time) if self.last_publish_time is not None else 0
-            
-            return (current_time - last_publish_time) >= rate_limit
-        except (ValueError, TypeError) as e:
-            self.logger.warning(f"Type error in can_publish comparison: {e}, defaulting to allow publish")
-            return True
+        # Disabled, or paused due to frame limit
+        if not self.enabled or self.frame_limit_reached:
+            return False
+        return self.rate_limit is None or time.monotonic() >= self._next_publish_at
     
     def publish(self, data: Dict[str, Any]) -> bool:
         """Publish data to destination with rate limiting and enabled check"""
@@ -315,19 +331,16 @@ class BaseResultDestination(ABC):
                 # Don't log to avoid spam (warning already logged when paused)
                 return False
             
-            # Check rate limit atomically with last_publish_time update
-            if self.rate_limit is not None:
-                current_time = time.time()
-                rate_limit = float(self.rate_limit)
-                last_publish_time = float(self.last_publish_time) if self.last_publish_time is not None else 0
-                
-                if (current_time - last_publish_time) < rate_limit:
-                    self.logger.debug("Rate limit exceeded, skipping publish")
-                    return False
+            # Check rate limit and claim the next slot in the same critical section
+            now = time.monotonic()
+            if now < self._next_publish_at:
+                self.logger.debug("Rate limit exceeded, skipping publish")
+                return False
             
-            # Update last_publish_time BEFORE publishing to prevent race condition
-            # This ensures that if another thread checks can_publish() now, it will see the updated time
-            self.last_publish_time = time.time()
+            # The slot is claimed BEFORE publishing so concurrent callers see it, and is not
+            # handed back on failure so a failing destination still honours the rate limit
+            if self.rate_limit:
+                self._next_publish_at = now + self.rate_limit
         
         # Now do the actual publish (outside the lock to allow concurrent publishes to different destinations)
         try:
@@ -348,15 +361,9 @@ class BaseResultDestination(ABC):
                 
                 return True
             else:
-                # Revert last_publish_time if publish failed
-                with self._lock:
-                    self.last_publish_time = 0
                 self._record_failure("Publish method returned False")
                 return False
         except Exception as e:
-            # Revert last_publish_time if publish failed
-            with self._lock:
-                self.last_publish_time = 0
             error_msg = f"Failed to publish: {str(e)}"
             self._record_failure(error_msg)
             return False
@@ -376,10 +383,11 @@ class BaseResultDestination(ABC):
             include_result_image: Whether to include result image in published results
             **kwargs: Additional subclass-specific parameters (ignored here)
         """
-        self.include_image_data = include_image_data
-        self.include_result_image = include_result_image
+        self.include_image_data = bool(include_image_data)
+        self.include_result_image = bool(include_result_image)
         self.set_rate_limit(rate_limit)
         self.set_max_frames(max_frames)
+        self._coerce_state()
     
     @abstractmethod
     def configure(self, **kwargs) -> None:
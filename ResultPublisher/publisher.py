@@ -8,13 +8,14 @@ import copy
 
 import cv2
 import numpy as np
-from .result_destinations import BaseResultDestination
+from .base_destination import BaseResultDestination
 
 class ResultPublisher:
     """Main result publisher that manages multiple destinations"""
     
     def __init__(self, max_workers: int = 4):
         self.destinations: List[BaseResultDestination] = []
+        self._by_id: Dict[str, BaseResultDestination] = {}  # str(destination._id) -> destination
         self.logger = logging.getLogger(self.__class__.__name__)
         self._lock = threading.Lock()
         # Thread pool for non-blocking publishing
@@ -32,6 +33,7 @@ class ResultPublisher:
                 destination._id = destination_id  # Add ID attribute to destination
             
             self.destinations.append(destination)
+            self._by_id[str(destination_id)] = destination
             self.logger.info(f"Added destination: {destination.__class__.__name__} with ID: {destination_id}")
             return destination_id
     
@@ -40,25 +42,23 @@ class ResultPublisher:
         with self._lock:
             if destination in self.destinations:
                 self.destinations.remove(destination)
+                self._by_id.pop(str(getattr(destination, '_id', None)), None)
                 self.logger.info(f"Removed destination: {destination.__class__.__name__}")
     
     def remove_by_id(self, destination_id: str) -> bool:
         """Remove a destination by its ID"""
         with self._lock:
-            for destination in self.destinations:
-                if hasattr(destination, '_id') and str(destination._id) == str(destination_id):
-                    self.destinations.remove(destination)
-                    self.logger.info(f"Removed destination with ID: {destination_id}")
-                    return True
-            return False
+            destination = self._by_id.pop(str(destination_id), None)
+            if destination is None:
+                return False
+            self.destinations.remove(destination)
+            self.logger.info(f"Removed destination with ID: {destination_id}")
+            return True
     
     def get_by_id(self, destination_id: str) -> Optional[BaseResultDestination]:
         """Get a destination by its ID"""
         with self._lock:
-            for destination in self.destinations:
-                if hasattr(destination, '_id') and str(destination._id) == str(destination_id):
-                    return destination
-            return None
+            return self._by_id.get(str(destination_id))
     
     def _publish_to_destination(self, destination: BaseResultDestination, data: Dict[str, Any]) -> bool:
         """Helper method to publish to a single destination"""
@@ -170,6 +170,7 @@ class ResultPublisher:
                         self.logger.error(f"Error closing {destination.__class__.__name__}: {str(e)}")
             
             self.destinations.clear()
+            self._by_id.clear()
             self.logger.info("All destinations cleared")
     
     def __enter__(self):
@@ -1,18 +1,18 @@
 # This file is maintained for backward compatibility
 # All destination classes have been moved to their own separate files
 
-# Import all destination classes from their new locations
+# Destination classes are resolved lazily through the package so importing this
+# module does not pull in every plugin's dependencies
 from .base_destination import BaseResultDestination
-from .plugins.null_destination import NullDestination
-from .plugins.mqtt_destination import MQTTDestination
-from .plugins.webhook_destination import WebhookDestination
-from .plugins.serial_destination import SerialDestination
-from .plugins.folder_destination import FolderDestination
-from .plugins.zeromq_destination import ZeroMQDestination
-from .plugins.opcua_destination import OPCUADestination
-from .plugins.ros2_destination import ROS2Destination
-from .plugins.roboflow_destination import RoboflowDestination
-from .plugins.geti_destination import GetiDestination
+
+
+def __getattr__(name: str):
+    from . import _destination_class, _PLUGIN_MODULES
+    if name not in _PLUGIN_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = _destination_class(name)
+    globals()[name] = cls
+    return cls
 
 # Export all classes for backward compatibility
 __all__ = [